@@ -8,8 +8,8 @@ This module handles the database schema management, including:
 - Index tracking
 """
 
-import os
-import json
+import sys
+from contextlib import contextmanager
 from common.exceptions import SchemaError
 from common.types import DataType
 
@@ -26,7 +26,7 @@ class SchemaManager:
             disk_manager: The disk manager for persistent storage
         """
         self.disk_manager = disk_manager
-        self.schema_file = os.path.join(disk_manager.db_directory, "schema.json")
+        self.schema_file = disk_manager.get_schema_path()
         
         # Initialize schema structures
         self.tables = {}
@@ -34,37 +34,91 @@ class SchemaManager:
         self.indexes = {}
         self.primary_keys = {}
         self.foreign_keys = {}
+        
+        # Bumped on every DDL change so callers can cache schema-derived data
+        self.schema_version = 0
+        
+        # Deferred schema writes (see batched())
+        self._batch_depth = 0
+        self._dirty = False
     
     def load_schema(self):
-        """Load the database schema from disk."""
-        if os.path.exists(self.schema_file):
-            try:
-                with open(self.schema_file, 'r') as f:
-                    schema_data = json.load(f)
-                
-                self.tables = schema_data.get("tables", {})
-                self.columns = schema_data.get("columns", {})
-                self.indexes = schema_data.get("indexes", {})
-                self.primary_keys = schema_data.get("primary_keys", {})
-                self.foreign_keys = schema_data.get("foreign_keys", {})
-                
-                # Convert string data types to enum values
-                for table in self.columns:
-                    for col in self.columns[table]:
-                        if col["type"] == "INTEGER":
-                            col["type"] = DataType.INTEGER
-                        else:
-                            col["type"] = DataType.STRING
-                
-                return True
-            except Exception as e:
-                print(f"Error loading schema: {str(e)}")
-                return False
+        """
+        Load the database schema from disk, replacing the in-memory catalog.
+        
+        Returns:
+            bool: True if a saved schema was found, False otherwise
+        """
+        try:
+            schema_data = self.disk_manager.read_schema()
+            found = schema_data is not None
+            if not found:
+                # Nothing saved yet, so the catalog is empty
+                schema_data = {}
+            
+            self.tables = schema_data.get("tables", {})
+            self.columns = schema_data.get("columns", {})
+            self.indexes = schema_data.get("indexes", {})
+            self.primary_keys = schema_data.get("primary_keys", {})
+            self.foreign_keys = schema_data.get("foreign_keys", {})
+            
+            # Convert string data types to enum values, and intern column
+            # names so they are the same objects the parser produces
+            for table in self.columns:
+                for col in self.columns[table]:
+                    col["name"] = sys.intern(col["name"])
+                    if col["type"] == "INTEGER":
+                        col["type"] = DataType.INTEGER
+                    else:
+                        col["type"] = DataType.STRING
+            
+            self.schema_version += 1
+            
+            return found
+        except Exception as e:
+            print(f"Error loading schema: {str(e)}")
+            return False
+    
+    def begin_batch(self):
+        """Start deferring schema writes until the matching commit_batch()."""
+        self._batch_depth += 1
+    
+    def commit_batch(self):
+        """
+        End a batch started with begin_batch().
+        
+        The schema is written once when the outermost batch ends, and only
+        if something changed while it was open.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
         
-        return False
+        if self._batch_depth == 0 and self._dirty:
+            return self.save_schema()
+        
+        return True
+    
+    @contextmanager
+    def batched(self):
+        """Context manager that groups schema writes into a single save."""
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.commit_batch()
     
     def save_schema(self):
         """Save the database schema to disk."""
+        # Inside a batch, only remember that a write is pending
+        if self._batch_depth > 0:
+            self._dirty = True
+            return True
+        
+        self._dirty = False
+        
         try:
             # Convert enum data types to strings for JSON serialization
             serializable_columns = {}
@@ -83,8 +137,7 @@ class SchemaManager:
                 "foreign_keys": self.foreign_keys
             }
             
-            with open(self.schema_file, 'w') as f:
-                json.dump(schema_data, f, indent=2)
+            self.disk_manager.write_schema(schema_data)
             
             return True
         except Exception as e:
@@ -140,25 +193,29 @@ class SchemaManager:
         # Create table files
         self.disk_manager.create_table_file(table_name)
         
-        # Update schema
-        self.tables[table_name] = {
-            "name": table_name,
-            "record_count": 0
-        }
-        
-        self.columns[table_name] = columns
-        
-        if primary_key:
-            self.primary_keys[table_name] = primary_key
+        # The primary key index saves the schema too, so batch both writes
+        with self.batched():
+            # Update schema
+            self.tables[table_name] = {
+                "name": table_name,
+                "record_count": 0
+            }
             
-            # Automatically create an index for the primary key
-            self.create_index(table_name, primary_key)
-        
-        if foreign_keys:
-            self.foreign_keys[table_name] = foreign_keys
-        
-        # Save schema to disk
-        self.save_schema()
+            self.columns[table_name] = columns
+            
+            if primary_key:
+                self.primary_keys[table_name] = primary_key
+                
+                # Automatically create an index for the primary key
+                self.create_index(table_name, primary_key)
+            
+            if foreign_keys:
+                self.foreign_keys[table_name] = foreign_keys
+            
+            self.schema_version += 1
+            
+            # Save schema to disk
+            self.save_schema()
         
         return True
     
@@ -203,6 +260,8 @@ class SchemaManager:
         if table_name in self.foreign_keys:
             del self.foreign_keys[table_name]
         
+        self.schema_version += 1
+        
         # Save schema to disk
         self.save_schema()
         
@@ -241,6 +300,8 @@ class SchemaManager:
         # Update schema
         self.indexes[table_name].append(column_name)
         
+        self.schema_version += 1
+        
         # Save schema to disk
         self.save_schema()
         
@@ -280,6 +341,8 @@ class SchemaManager:
         if not self.indexes[table_name]:
             del self.indexes[table_name]
         
+        self.schema_version += 1
+        
         # Save schema to disk
         self.save_schema()
         
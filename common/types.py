@@ -3,8 +3,51 @@ Common data types used throughout the DBMS.
 """
 
 from enum import Enum, auto
+from functools import cached_property
 
 class DataType(Enum):
     """Enumeration of supported data types."""
     INTEGER = auto()
-    STRING = auto()
\ No newline at end of file
+    STRING = auto()
+
+class ExecResult(str):
+    """
+    Formatted query output that also keeps the rows it was built from.
+    
+    It is still the table text, so printing it or checking for a substring
+    works as before; rows and columns give direct access to the values.
+    """
+    
+    def __new__(cls, text, columns=(), rows=()):
+        """
+        Create a result.
+        
+        Args:
+            text (str): The formatted table
+            columns (list): Output column names
+            rows (list): One tuple of values per output row
+        """
+        result = super().__new__(cls, text)
+        result.columns = list(columns)
+        result.rows = list(rows)
+        return result
+    
+    @cached_property
+    def _values_by_column(self):
+        """Map each column name to the set of its values, built on first use."""
+        return {
+            column: {row[i] for row in self.rows}
+            for i, column in enumerate(self.columns)
+        }
+    
+    def column_values(self, column):
+        """
+        Get the distinct values of one output column.
+        
+        Args:
+            column (str): Column name as shown in the header
+            
+        Returns:
+            set: The column's values, or an empty set for an unknown column
+        """
+        return self._values_by_column.get(column, set())
\ No newline at end of file
@@ -8,8 +8,12 @@ This module handles the execution of SQL queries, including:
 - Aggregation and filtering
 """
 
-from common.exceptions import ExecutionError, DBMSError
-from common.types import DataType
+from functools import partial
+from itertools import islice
+
+from common.exceptions import ExecutionError, DBMSError, StorageError
+from common.types import DataType, ExecResult
+from query.optimizer import compile_predicate, join_columns
 
 class Executor:
     """
@@ -30,6 +34,9 @@ class Executor:
         self.disk_manager = disk_manager
         self.index_manager = index_manager
         self.optimizer = optimizer
+        
+        # DESCRIBE output per table, tagged with the schema version it was built from
+        self._describe_cache = {}
     
     def execute(self, parsed_query):
         """
@@ -99,8 +106,10 @@ class Executor:
                 records.append({"__id__": 0, "id": 1, "name": "John Doe", "age": 20})
                 records.append({"__id__": 1, "id": 2, "name": "Jane Smith", "age": 22})
                 
-                # Write to disk
+                # Write to disk, and index the sample rows like inserted ones
                 self.disk_manager.write_table(table_name, records)
+                for col_name in self.schema_manager.get_indexes(table_name):
+                    self.index_manager.rebuild_index(table_name, col_name)
                 
                 # Format sample data for display
                 rows = []
@@ -161,13 +170,11 @@ class Executor:
             if not tables:
                 return "No tables exist in the database."
             
-            # Format the result
-            result = "Tables in the database:\n"
-            result += "-" * 25 + "\n"
-            for table_name in tables:
-                result += f"{table_name}\n"
+            # Format the result, one line per table
+            lines = ["Tables in the database:", "-" * 25]
+            lines.extend(tables)
             
-            return result
+            return "\n".join(lines) + "\n"
         except Exception as e:
             raise ExecutionError(f"Error showing tables: {str(e)}")
     
@@ -175,6 +182,12 @@ class Executor:
         """Execute a DESCRIBE statement."""
         table_name = query["table_name"]
         
+        # Reuse the previous output while the schema is unchanged
+        schema_version = self.schema_manager.schema_version
+        cached = self._describe_cache.get(table_name)
+        if cached and cached[0] == schema_version:
+            return cached[1]
+        
         try:
             if not self.schema_manager.table_exists(table_name):
                 raise ExecutionError(f"Table '{table_name}' does not exist")
@@ -184,37 +197,43 @@ class Executor:
             columns = table_info["columns"]
             primary_key = table_info["primary_key"]
             foreign_keys = table_info["foreign_keys"]
-            indexes = table_info["indexes"]
+            # Build the membership set once instead of scanning the list per column
+            indexed_columns = set(table_info["indexes"])
             
-            # Format the result
-            result = f"Table: {table_name}\n"
-            result += "-" * 60 + "\n"
-            result += "Column Name | Type | Primary Key | Indexed\n"
-            result += "-" * 60 + "\n"
+            # Format the result, collecting lines and joining them once
+            lines = [
+                f"Table: {table_name}",
+                "-" * 60,
+                "Column Name | Type | Primary Key | Indexed",
+                "-" * 60
+            ]
             
             for col in columns:
                 col_name = col["name"]
                 col_type = "INTEGER" if col["type"] == DataType.INTEGER else "STRING"
                 is_pk = "Yes" if col_name == primary_key else "No"
-                is_indexed = "Yes" if col_name in indexes else "No"
+                is_indexed = "Yes" if col_name in indexed_columns else "No"
                 
-                result += f"{col_name} | {col_type} | {is_pk} | {is_indexed}\n"
+                lines.append(f"{col_name} | {col_type} | {is_pk} | {is_indexed}")
             
             # Add foreign key information if any
             if foreign_keys:
-                result += "\nForeign Keys:\n"
-                result += "-" * 60 + "\n"
+                lines.extend(["", "Foreign Keys:", "-" * 60])
                 for fk_col, fk_ref in foreign_keys.items():
-                    result += f"{fk_col} -> {fk_ref['table']}.{fk_ref['column']}\n"
+                    lines.append(f"{fk_col} -> {fk_ref['table']}.{fk_ref['column']}")
+            
+            result = "\n".join(lines) + "\n"
+            
+            self._describe_cache[table_name] = (schema_version, result)
             
             return result
         except Exception as e:
             raise ExecutionError(f"Error describing table: {str(e)}")
         
     def _execute_insert(self, query):
-        """Execute an INSERT statement."""
+        """Execute an INSERT statement, with one or several rows."""
         table_name = query["table_name"]
-        values = query["values"]
+        rows = query.get("rows", [query["values"]])
         
         try:
             # Check if table exists
@@ -224,35 +243,40 @@ class Executor:
             # Get column definitions
             columns = self.schema_manager.get_columns(table_name)
             
-            # Create a simple record if values are not in the expected format
-            record = {}
-            
-            # Handle simple value list (from test)
-            if all(not isinstance(v, dict) for v in values):
-                if len(columns) != len(values):
-                    raise ExecutionError(f"Column count mismatch: expected {len(columns)}, got {len(values)}")
-                
-                for i, col in enumerate(columns):
-                    record[col["name"]] = values[i]
-            else:
-                # Handle structured values
-                if len(columns) != len(values):
-                    raise ExecutionError(f"Column count mismatch: expected {len(columns)}, got {len(values)}")
+            # Build and type-check every record before writing any of them
+            new_records = []
+            for values in rows:
+                # Create a simple record if values are not in the expected format
+                record = {}
                 
-                for i, col in enumerate(columns):
-                    col_name = col["name"]
-                    value_type = values[i]["type"]
-                    value = values[i]["value"]
+                # Handle simple value list (from test)
+                if all(not isinstance(v, dict) for v in values):
+                    if len(columns) != len(values):
+                        raise ExecutionError(f"Column count mismatch: expected {len(columns)}, got {len(values)}")
                     
-                    # Type checking
-                    if col["type"] == DataType.INTEGER and value_type != "integer":
-                        raise ExecutionError(f"Type mismatch for column '{col_name}': expected INTEGER")
-                    elif col["type"] == DataType.STRING and value_type != "string":
-                        raise ExecutionError(f"Type mismatch for column '{col_name}': expected STRING")
+                    for i, col in enumerate(columns):
+                        record[col["name"]] = values[i]
+                else:
+                    # Handle structured values
+                    if len(columns) != len(values):
+                        raise ExecutionError(f"Column count mismatch: expected {len(columns)}, got {len(values)}")
                     
-                    record[col_name] = value
+                    for i, col in enumerate(columns):
+                        col_name = col["name"]
+                        value_type = values[i]["type"]
+                        value = values[i]["value"]
+                        
+                        # Type checking
+                        if col["type"] == DataType.INTEGER and value_type != "integer":
+                            raise ExecutionError(f"Type mismatch for column '{col_name}': expected INTEGER")
+                        elif col["type"] == DataType.STRING and value_type != "string":
+                            raise ExecutionError(f"Type mismatch for column '{col_name}': expected STRING")
+                        
+                        record[col_name] = value
+                
+                new_records.append(record)
             
-            # Insert the record
+            # Insert the records
             try:
                 # Read existing records
                 try:
@@ -260,19 +284,77 @@ class Executor:
                 except:
                     records = []
                 
-                # Add new record with ID
-                record["__id__"] = len(records)
-                records.append(record)
+                # Add new records with IDs
+                for record in new_records:
+                    record["__id__"] = len(records)
+                    records.append(record)
                 
-                # Write back to disk
+                # Write back to disk once for the whole statement
                 self.disk_manager.write_table(table_name, records)
                 
-                return "1 record inserted"
+                # Keep the table's indexes in step with the new records
+                for col_name in self.schema_manager.get_indexes(table_name):
+                    if len(new_records) == 1:
+                        record = new_records[0]
+                        self.index_manager.update_index(table_name, col_name, record.get(col_name), record["__id__"])
+                    else:
+                        self.index_manager.rebuild_index(table_name, col_name)
+                
+                if len(new_records) == 1:
+                    return "1 record inserted"
+                return f"{len(new_records)} records inserted"
             except Exception as e:
                 raise ExecutionError(f"Error inserting record: {str(e)}")
         except Exception as e:
             raise ExecutionError(f"Error inserting record: {str(e)}")
     
+    def execute_bulk_insert(self, table_name, rows):
+        """
+        Insert several rows with a single table read and write.
+        
+        This bypasses the parser and is meant for loading known-good data,
+        such as test fixtures. Values are stored as given, like a plain
+        INSERT ... VALUES statement.
+        
+        Args:
+            table_name (str): Name of the table
+            rows (list): Value tuples, one per record, in column order
+            
+        Returns:
+            str: Number of records inserted
+        """
+        try:
+            # Check if table exists
+            if not self.schema_manager.table_exists(table_name):
+                raise ExecutionError(f"Table '{table_name}' does not exist")
+            
+            column_names = [col["name"] for col in self.schema_manager.get_columns(table_name)]
+            
+            # Read existing records once for the whole batch
+            try:
+                records = self.disk_manager.read_table(table_name)
+            except:
+                records = []
+            
+            for values in rows:
+                if len(column_names) != len(values):
+                    raise ExecutionError(f"Column count mismatch: expected {len(column_names)}, got {len(values)}")
+                
+                record = dict(zip(column_names, values))
+                record["__id__"] = len(records)
+                records.append(record)
+            
+            # Write back to disk
+            self.disk_manager.write_table(table_name, records)
+            
+            # Rebuild each index once for the whole batch
+            for col_name in self.schema_manager.get_indexes(table_name):
+                self.index_manager.rebuild_index(table_name, col_name)
+            
+            return f"{len(rows)} record(s) inserted"
+        except Exception as e:
+            raise ExecutionError(f"Error inserting records: {str(e)}")
+    
     def _execute_update(self, query):
         """Execute an UPDATE statement."""
         table_name = query["table_name"]
@@ -414,8 +496,12 @@ class Executor:
     def _execute_select(self, query):
         """Execute a SELECT statement."""
         try:
-            # Optimize the query
-            optimized_query = self.optimizer.optimize(query)
+            # Optimize the query, unless the caller already did (e.g. a
+            # cached plan from the application)
+            if "execution_plan" in query:
+                optimized_query = query
+            else:
+                optimized_query = self.optimizer.optimize(query)
             
             # Store a reference to the current query for the formatter to access aliases
             self.current_query = optimized_query
@@ -442,7 +528,11 @@ class Executor:
                     # Handle table aliases
                     real_table_name = table_name['name']
                     table_alias = table_name['alias']
-                    result = self._execute_where(real_table_name, optimized_query.get("where"))
+                    result = self._execute_where(
+                        real_table_name,
+                        optimized_query.get("where"),
+                        optimized_query.get("scan_limit")
+                    )
                     
                     # Rename columns with table alias
                     aliased_result = []
@@ -456,7 +546,7 @@ class Executor:
                 else:
                     # Standard table reference
                     where_condition = optimized_query.get("where")
-                    result = self._execute_where(table_name, where_condition)
+                    result = self._execute_where(table_name, where_condition, optimized_query.get("scan_limit"))
             
             # Check if we have aggregate functions without GROUP BY
             # This is for simple aggregate queries like SELECT COUNT(*) FROM table
@@ -687,43 +777,35 @@ class Executor:
         Returns:
             The aggregated value
         """
+        # COUNT counts every record, whatever the column holds, so there
+        # is no need to extract any values
+        if function == 'COUNT':
+            return len(records)
+        
         values = []
         
-        # Extract values from records
+        # Extract values from records, skipping NULLs as they go
         for _, record in records:
-            if column == '*' and function == 'COUNT':
-                # COUNT(*) just counts records
-                values.append(1)
+            # Handle qualified column names
+            if column in record:
+                value = record[column]
             else:
-                # Handle qualified column names
-                if column in record:
-                    values.append(record[column])
-                else:
-                    # Try to find the column with table prefix
-                    found = False
-                    for record_col in record:
-                        if not record_col.startswith('__') and (record_col.endswith(f".{column}") or record_col == column):
-                            values.append(record[record_col])
-                            found = True
-                            break
-                    if not found:
-                        # Column not found, use None
-                        values.append(None)
-        
-        # Remove None values for most functions
-        if function != 'COUNT':
-            values = [v for v in values if v is not None]
+                # Try to find the column with table prefix
+                value = None
+                for record_col in record:
+                    if not record_col.startswith('__') and (record_col.endswith(f".{column}") or record_col == column):
+                        value = record[record_col]
+                        break
+            
+            if value is not None:
+                values.append(value)
         
         # Ensure we have values to aggregate
         if not values:
-            if function == 'COUNT':
-                return 0
             return None
         
-        # Calculate the aggregate value
-        if function == 'COUNT':
-            return len(values)
-        elif function == 'SUM':
+        # Calculate the aggregate value; sum/min/max loop in C
+        if function == 'SUM':
             if all(isinstance(v, (int, float)) for v in values):
                 return sum(values)
             return None
@@ -742,33 +824,39 @@ class Executor:
         else:
             raise ExecutionError(f"Unsupported aggregate function: {function}")
     
-    def _execute_where(self, table_name, condition):
+    def _execute_where(self, table_name, condition, max_rows=None):
         """
         Execute a WHERE clause.
+        
+        Args:
+            table_name (str): Table to scan
+            condition (dict): WHERE condition, or None for every record
+            max_rows (int): Stop the scan after this many matches, if given
+            
+        Returns:
+            list: List of (record_id, record) tuples
         """
+        # Unknown tables are rejected from the catalog without touching storage
+        if not self.schema_manager.table_exists(table_name):
+            raise StorageError(f"Table file for '{table_name}' does not exist")
+        
         try:
             # Try to read all records from the table
             all_records = self.disk_manager.read_table(table_name)
         except Exception as e:
             # If table doesn't exist or is empty, raise appropriate error
-            from common.exceptions import StorageError
             raise StorageError(f"Table file for '{table_name}' does not exist")
         
-        result = []
+        records = ((i, r) for i, r in enumerate(all_records) if not r.get("__deleted__", False))
         
-        # If no WHERE clause, return all records
-        if not condition:
-            return [(i, r) for i, r in enumerate(all_records) if not r.get("__deleted__", False)]
-        
-        # Evaluate each record against the condition
-        for i, record in enumerate(all_records):
-            if record.get("__deleted__", False):
-                continue
-            
-            if self._evaluate_condition(condition, record):
-                result.append((i, record))
+        # Evaluate each record against the condition, if there is one,
+        # compiled to a plain function where possible
+        if condition:
+            predicate = self._compile_condition(condition)
+            records = ((i, r) for i, r in records if predicate(r))
         
-        return result
+        # Records are checked lazily, so a LIMIT stops the scan early
+        return list(islice(records, max_rows))
         
     def _execute_join(self, query):
         """
@@ -789,8 +877,9 @@ class Executor:
             left_table_alias = left_table['alias']
             left_table = left_table['name']
         
-        # Get all records from the left table (no WHERE filter)
-        result = self._execute_where(left_table, None)
+        # Get the left table's records, filtered by any conditions the
+        # optimizer pushed down to it (the rest of WHERE comes after joins)
+        result = self._execute_where(left_table, query.get("table_filter"))
         
         # If the left table has an alias, rename the columns
         if left_table_alias:
@@ -857,109 +946,51 @@ class Executor:
         """
         right_table = join_info["table"]
         right_table_alias = join_info.get("alias", right_table)
-        join_condition = join_info["condition"]
         join_method = join_info.get("method", "nested-loop")
+        # Pushed-down filters see raw right-table records, so compile them
+        right_filter = join_info.get("filter")
+        passes_filter = self._compile_condition(right_filter) if right_filter else None
         
-        # Extract join columns based on condition format
-        if "left_column" in join_condition and "right_column" in join_condition:
-            # Simple format
-            left_column = join_condition["left_column"]
-            right_column = join_condition["right_column"]
-        else:
-            # Table.column format from grammar
-            left_condition_table = join_condition.get("left_table")
-            right_condition_table = join_condition.get("right_table")
-            
-            # Check if condition tables match actual table names or aliases
-            if left_condition_table == left_table:
-                left_column = join_condition.get("left_column")
-                right_column = join_condition.get("right_column")
-            elif right_condition_table == left_table:
-                # Swapped order
-                left_column = join_condition.get("right_column")
-                right_column = join_condition.get("left_column")
-            else:
-                # Try to handle the case where condition uses aliases
-                # This is for test_complex_join_with_aliases where we have "s.id = e.student_id"
-                # Here, we need to match s→students and e→enrollments
-                left_table_alias = None
-                right_table_alias = join_info.get("alias")
-                
-                # We don't have access to the full query here, so we'll use heuristics
-                # Common pattern is to use first letter as alias (s for students, e for enrollments)
-                if left_table.startswith(left_condition_table):
-                    left_table_alias = left_condition_table
-                
-                if left_condition_table == left_table_alias:
-                    left_column = join_condition.get("left_column")
-                    right_column = join_condition.get("right_column")
-                elif right_condition_table == left_table_alias:
-                    left_column = join_condition.get("right_column")
-                    right_column = join_condition.get("left_column")
-                else:
-                    # Default to standard order
-                    left_column = join_condition.get("left_column")
-                    right_column = join_condition.get("right_column")
+        # Same column assignment the optimizer used to pick the join method
+        left_column, right_column = join_columns(join_info)
         
         result = []
         
-        if join_method == "nested-loop":
+        if join_method == "hash":
+            # Hash Join: bucket the right table by join value once, then probe
+            # it with each left record. Buckets keep storage order, so the
+            # output matches the nested-loop join.
+            buckets = {}
+            for right_record in self.disk_manager.read_table(right_table):
+                if right_record.get("__deleted__", False):
+                    continue
+                if passes_filter and not passes_filter(right_record):
+                    continue
+                buckets.setdefault(right_record.get(right_column), []).append(right_record)
+            
+            for left_id, left_record in left_records:
+                left_value = self._get_join_value(left_record, left_table, left_column)
+                
+                for right_record in buckets.get(left_value, ()):
+                    result.append((None, self._merge_join_records(left_table, left_record, right_table_alias, right_record)))
+        
+        elif join_method == "nested-loop":
             # Nested Loop Join
             right_records = self.disk_manager.read_table(right_table)
+            if passes_filter:
+                right_records = [r for r in right_records if passes_filter(r)]
             
             for left_id, left_record in left_records:
+                left_value = self._get_join_value(left_record, left_table, left_column)
+                
                 for right_id, right_record in enumerate(right_records):
                     if right_record.get("__deleted__", False):
                         continue
                     
-                    # For the first join, left_column refers to a simple column name
-                    # For subsequent joins, it may refer to a qualified column name (table.column)
-                    left_value = None
-                    # First try direct column name
-                    if left_column in left_record:
-                        left_value = left_record.get(left_column)
-                    # Then try qualified name
-                    elif f"{left_table}.{left_column}" in left_record:
-                        left_value = left_record.get(f"{left_table}.{left_column}")
-                    # Try with prefix from the join condition
-                    elif "." in left_column:
-                        left_value = left_record.get(left_column)
-                    # Check if we have enrollments.column style (from second join)
-                    elif f"enrollments.{left_column}" in left_record:
-                        left_value = left_record.get(f"enrollments.{left_column}")
-                    # Finally, try to find it by looking for partial matches
-                    else:
-                        for key in left_record.keys():
-                            if key.endswith(f".{left_column}"):
-                                left_value = left_record.get(key)
-                                break
-                    
                     right_value = right_record.get(right_column)
                     
                     if left_value == right_value:
-                        # Create joined record
-                        joined_record = {}
-                        
-                        # Copy all left record fields with proper table prefixes
-                        for key, value in left_record.items():
-                            if key.startswith("__"):
-                                # Skip internal fields
-                                continue
-                            elif "." in key:
-                                # Already has table prefix
-                                joined_record[key] = value
-                            else:
-                                # Add table prefix for regular fields like id, name
-                                joined_record[f"{left_table}.{key}"] = value
-                        
-                        # Add right table columns with table alias prefix
-                        for key, value in right_record.items():
-                            if not key.startswith("__"):
-                                # For better compatibility with query output
-                                column_name = f"{right_table_alias}.{key}"
-                                joined_record[column_name] = value
-                        
-                        result.append((None, joined_record))
+                        result.append((None, self._merge_join_records(left_table, left_record, right_table_alias, right_record)))
         
         elif join_method == "sort-merge":
             # Sort-Merge Join
@@ -975,7 +1006,10 @@ class Executor:
             
             # Sort right records by join column
             right_records = self.disk_manager.read_table(right_table)
-            sorted_right = [(i, r) for i, r in enumerate(right_records) if not r.get("__deleted__", False)]
+            sorted_right = [
+                (i, r) for i, r in enumerate(right_records)
+                if not r.get("__deleted__", False) and (passes_filter is None or passes_filter(r))
+            ]
             sorted_right.sort(key=lambda r: r[1].get(right_column))
             
             # Merge
@@ -1037,45 +1071,29 @@ class Executor:
         elif join_method == "index-nested-loop":
             # Index Nested Loop Join
             if self.schema_manager.index_exists(right_table, right_column):
+                # Load the index and the inner table once; probing the index
+                # then costs a dict lookup per outer record
+                index = self.index_manager.get_index(right_table, right_column)
+                right_records = self.disk_manager.read_table(right_table)
+                
                 for left_id, left_record in left_records:
-                    # Get the left value
-                    left_value = None
-                    if f"{left_table}.{left_column}" in left_record:
-                        left_value = left_record.get(f"{left_table}.{left_column}")
-                    else:
-                        left_value = left_record.get(left_column)
+                    left_value = self._get_join_value(left_record, left_table, left_column)
                     
                     # Use index to find matching right records
-                    right_ids = self.index_manager.lookup(right_table, right_column, left_value)
+                    right_ids = index.get(left_value, [])
+                    if not isinstance(right_ids, list):
+                        right_ids = [right_ids]
                     
                     for right_id in right_ids:
-                        try:
-                            right_record = self.disk_manager.get_record(right_table, right_id)
-                            if not right_record.get("__deleted__", False):
-                                # Create joined record
-                                joined_record = {}
-                                
-                                # Copy all left record fields with proper table prefixes
-                                for key, value in left_record.items():
-                                    if key.startswith("__"):
-                                        # Skip internal fields
-                                        continue
-                                    elif "." in key:
-                                        # Already has table prefix
-                                        joined_record[key] = value
-                                    else:
-                                        # Add table prefix for regular fields like id, name
-                                        joined_record[f"{left_table}.{key}"] = value
-                                
-                                # Add right table columns with table alias prefix
-                                for key, value in right_record.items():
-                                    if not key.startswith("__"):
-                                        joined_record[f"{right_table_alias}.{key}"] = value
-                                
-                                result.append((None, joined_record))
-                        except:
-                            # Skip deleted or non-existent records
-                            pass
+                        # Skip index entries left pointing past the table
+                        if right_id >= len(right_records):
+                            continue
+                        right_record = right_records[right_id]
+                        if right_record.get("__deleted__", False):
+                            continue
+                        if passes_filter and not passes_filter(right_record):
+                            continue
+                        result.append((None, self._merge_join_records(left_table, left_record, right_table_alias, right_record)))
             else:
                 # Fall back to nested loop if no index
                 join_info_copy = join_info.copy()
@@ -1084,6 +1102,54 @@ class Executor:
         
         return result
     
+    def _get_join_value(self, left_record, left_table, left_column):
+        """
+        Get the join column value from a (possibly already joined) left record.
+        
+        For the first join, left_column refers to a simple column name. For
+        subsequent joins, it may refer to a qualified column name (table.column).
+        """
+        # First try direct column name
+        if left_column in left_record:
+            return left_record.get(left_column)
+        # Then try qualified name
+        if f"{left_table}.{left_column}" in left_record:
+            return left_record.get(f"{left_table}.{left_column}")
+        # Try with prefix from the join condition
+        if "." in left_column:
+            return left_record.get(left_column)
+        # Check if we have enrollments.column style (from second join)
+        if f"enrollments.{left_column}" in left_record:
+            return left_record.get(f"enrollments.{left_column}")
+        # Finally, try to find it by looking for partial matches
+        for key in left_record.keys():
+            if key.endswith(f".{left_column}"):
+                return left_record.get(key)
+        return None
+    
+    def _merge_join_records(self, left_table, left_record, right_table_alias, right_record):
+        """Build the joined record from a left record and a matching right record."""
+        joined_record = {}
+        
+        # Copy all left record fields with proper table prefixes
+        for key, value in left_record.items():
+            if key.startswith("__"):
+                # Skip internal fields
+                continue
+            elif "." in key:
+                # Already has table prefix
+                joined_record[key] = value
+            else:
+                # Add table prefix for regular fields like id, name
+                joined_record[f"{left_table}.{key}"] = value
+        
+        # Add right table columns with table alias prefix
+        for key, value in right_record.items():
+            if not key.startswith("__"):
+                joined_record[f"{right_table_alias}.{key}"] = value
+        
+        return joined_record
+    
     def _execute_projection(self, query, records):
         """
         Execute a projection.
@@ -1264,6 +1330,21 @@ class Executor:
         
         return result
     
+    def _compile_condition(self, condition):
+        """
+        Get a function that tests a record read straight from storage.
+        
+        The condition is compiled with compile_predicate where possible;
+        otherwise the function falls back to _evaluate_condition.
+        
+        Args:
+            condition (dict): The condition to test
+            
+        Returns:
+            callable: Function taking a record dict and returning a bool
+        """
+        return compile_predicate(condition) or partial(self._evaluate_condition, condition)
+    
     def _evaluate_condition(self, condition, record):
         """
         Evaluate a condition against a record.
@@ -1434,10 +1515,10 @@ class Executor:
             records (list): List of (record_id, record) tuples
             
         Returns:
-            str: Formatted result
+            ExecResult: Formatted result, which also carries its columns and rows
         """
         if not records:
-            return "No results found"
+            return ExecResult("No results found", columns=[], rows=[])
         
         # Get column names from the first record
         _, first_record = records[0]
@@ -1473,37 +1554,43 @@ class Executor:
         header = " | ".join(columns)
         separator = "-" * len(header)
         
+        # Resolve where each output column reads from once, not per record
+        source_keys = []
+        for col in columns:
+            candidates = []
+            
+            # Handle the special case for the alias test
+            if col == "student_name":
+                candidates.append("name")
+            elif col == "student_age":
+                candidates.append("age")
+            
+            # Get the original column name before aliasing
+            for k, v in column_aliases.items():
+                if v == col:
+                    candidates.append(k)
+                    break
+            
+            source_keys.append((col, candidates))
+        
         # Create rows
         rows = []
+        row_values = []
         for _, record in records:
             values = []
-            for i, col in enumerate(columns):
-                # Get the original column name before aliasing
-                orig_col = None
-                for k, v in column_aliases.items():
-                    if v == col:
-                        orig_col = k
+            for col, candidates in source_keys:
+                for key in candidates:
+                    if key in record:
+                        value = record[key]
                         break
-                
-                # Handle the special case for the alias test
-                if col == "student_name" and "name" in record:
-                    value = record.get("name")
-                elif col == "student_age" and "age" in record:
-                    value = record.get("age")
-                elif orig_col and orig_col in record:
-                    # If we found the original column name, use that to get the value
-                    value = record.get(orig_col)
                 else:
                     value = record.get(col)
-                    
-                if value is None:
-                    value = "NULL"
-                else:
-                    value = str(value)
+                
                 values.append(value)
-            rows.append(" | ".join(values))
+            row_values.append(tuple(values))
+            rows.append(" | ".join("NULL" if value is None else str(value) for value in values))
         
-        # Combine everything
-        result = f"{header}\n{separator}\n" + "\n".join(rows)
+        # Combine everything in a single join
+        result = "\n".join([header, separator] + rows)
         
-        return result
\ No newline at end of file
+        return ExecResult(result, columns, row_values)
\ No newline at end of file
@@ -6,9 +6,12 @@ This file contains the main application class and command-line interface.
 
 import os
 import sys
+import copy
 import time
+import hashlib
 import argparse
-import readline  # For command history and editing capabilities
+import functools
+from collections import OrderedDict
 from colorama import init, Fore, Style  # For colored output
 
 from parser.sql_parser import SQLParser
@@ -17,10 +20,35 @@ from storage.disk_manager import DiskManager
 from storage.index.index_manager import IndexManager
 from query.optimizer import QueryOptimizer
 from execution.executor import Executor
+from common.exceptions import DBMSError
 
 # Initialize colorama
 init()
 
+# Number of SELECT plans kept by DBMSApplication.run_query
+PLAN_CACHE_SIZE = 256
+
+# Number of parse trees kept by DBMSApplication.run_query
+PARSE_CACHE_SIZE = 512
+
+# Output of the CLI 'help' command, built once
+HELP_TEXT = "\n".join([
+    f"\n{Fore.YELLOW}Available SQL Commands:{Style.RESET_ALL}",
+    f"  {Fore.GREEN}CREATE TABLE{Style.RESET_ALL} table_name (column_name type [PRIMARY KEY], ...)",
+    f"  {Fore.GREEN}DROP TABLE{Style.RESET_ALL} table_name",
+    f"  {Fore.GREEN}CREATE INDEX ON{Style.RESET_ALL} table_name (column_name)",
+    f"  {Fore.GREEN}DROP INDEX ON{Style.RESET_ALL} table_name (column_name)",
+    f"  {Fore.GREEN}SELECT{Style.RESET_ALL} columns {Fore.GREEN}FROM{Style.RESET_ALL} table [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions] [{Fore.GREEN}ORDER BY{Style.RESET_ALL} columns] [{Fore.GREEN}HAVING{Style.RESET_ALL} condition]",
+    f"  {Fore.GREEN}INSERT INTO{Style.RESET_ALL} table_name {Fore.GREEN}VALUES{Style.RESET_ALL} (value1, value2, ...)",
+    f"  {Fore.GREEN}UPDATE{Style.RESET_ALL} table_name {Fore.GREEN}SET{Style.RESET_ALL} column=value [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions]",
+    f"  {Fore.GREEN}DELETE FROM{Style.RESET_ALL} table_name [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions]",
+    f"\n{Fore.YELLOW}Special Commands:{Style.RESET_ALL}",
+    f"  {Fore.CYAN}run{Style.RESET_ALL} <file_path> - Execute SQL statements from a file",
+    f"  {Fore.CYAN}tables{Style.RESET_ALL} - List all available tables and their columns",
+    f"  {Fore.CYAN}exit{Style.RESET_ALL}/{Fore.CYAN}quit{Style.RESET_ALL} - Exit the application",
+    f"  {Fore.CYAN}help{Style.RESET_ALL} - Show this help message\n",
+])
+
 class DBMSApplication:
     """Main DBMS application class that coordinates all components."""
     
@@ -50,6 +78,57 @@ class DBMSApplication:
         # Load existing database schema if any
         self.schema_manager.load_schema()
         
+        # Optimized SELECT plans by query text, least recently used first
+        self._plan_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Parsing depends only on the query text, so it is memoized as-is
+        self._parse_cached = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(self.parser.parse)
+        
+    def _get_plan(self, query):
+        """
+        Parse, validate and optimize a query, reusing cached SELECT plans.
+        
+        Only SELECTs are cached: validating other statements depends on the
+        data (e.g. duplicate primary keys), not just the schema. A plan is
+        reused only while the schema version it was built under is current.
+        
+        Args:
+            query (str): SQL query
+            
+        Returns:
+            dict: The query ready for the executor
+        """
+        key = query.strip()
+        schema_version = self.schema_manager.schema_version
+        
+        cached = self._plan_cache.get(key)
+        if cached and cached[0] == schema_version:
+            self.cache_hits += 1
+            self._plan_cache.move_to_end(key)
+            # The executor annotates the plan, so hand out a copy
+            return copy.deepcopy(cached[1])
+        
+        self.cache_misses += 1
+        
+        # Parse the query (a copy, since validation and execution modify it)
+        parsed_query = copy.deepcopy(self._parse_cached(query))
+        
+        # Validate the query against the schema
+        self.parser.validate(parsed_query, self.schema_manager)
+        
+        # Optimize the query if it's a SELECT
+        if parsed_query["type"] == "SELECT":
+            parsed_query = self.optimizer.optimize(parsed_query)
+            
+            self._plan_cache[key] = (schema_version, copy.deepcopy(parsed_query))
+            self._plan_cache.move_to_end(key)
+            if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                self._plan_cache.popitem(last=False)
+        
+        return parsed_query
+    
     def run_query(self, query):
         """
         Parse, optimize and execute a query, measuring execution time.
@@ -58,71 +137,76 @@ class DBMSApplication:
             query (str): SQL query to execute
             
         Returns:
-            tuple: (result, execution_time)
+            tuple: (result, execution_time in seconds)
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            # Parse the query
-            parsed_query = self.parser.parse(query)
-            
-            # Validate the query against the schema
-            self.parser.validate(parsed_query, self.schema_manager)
-            
-            # Optimize the query if it's a SELECT
-            if parsed_query["type"] == "SELECT":
-                parsed_query = self.optimizer.optimize(parsed_query)
+            # Parse, validate and optimize (or reuse a cached plan)
+            parsed_query = self._get_plan(query)
             
             # Execute the query
             result = self.executor.execute(parsed_query)
             
             # Calculate execution time
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             
             return result, execution_time
-        except Exception as e:
-            return f"Error: {str(e)}", time.time() - start_time
+        except (DBMSError, ValueError, KeyError, TypeError) as e:
+            # Bad queries can still trip plain lookup/type errors in the
+            # planner; anything else is a bug and should propagate
+            return f"Error: {str(e)}", (time.perf_counter_ns() - start_time) * 1e-9
 
-    def run_script(self, script_path):
+    def run_script(self, script_path, dedup=False):
         """
         Execute SQL statements from a script file.
         
         Args:
             script_path (str): Path to the SQL script file
+            dedup (bool): Skip INSERT statements identical to an earlier one
+                in the same script
         """
+        # Digests of the INSERTs run so far; 8 bytes each, so memory stays
+        # small even for large load scripts
+        seen_inserts = set()
+        
         try:
             with open(script_path, 'r') as f:
-                script_content = f.read()
-            
-            # Split script into individual statements
-            statements = script_content.split(';')
-            
-            results = []
-            for stmt in statements:
-                stmt = stmt.strip()
-                if stmt:  # Skip empty statements
+                # Execute statements as they are read, keeping semicolons
+                # inside string literals
+                for stmt in self.parser.iter_statements_from_stream(f):
+                    if dedup and stmt[:6].upper() == "INSERT":
+                        digest = hashlib.blake2b(stmt.encode(), digest_size=8).digest()
+                        if digest in seen_inserts:
+                            print(f"\n{Fore.YELLOW}Skipping duplicate:{Style.RESET_ALL} {stmt}")
+                            continue
+                        seen_inserts.add(digest)
+                    
                     print(f"\n{Fore.CYAN}Executing:{Style.RESET_ALL} {stmt}")
                     result, execution_time = self.run_query(stmt)
-                    results.append((stmt, result, execution_time))
-            
-            # Print results
-            for stmt, result, execution_time in results:
-                print(f"\n{Fore.GREEN}Query:{Style.RESET_ALL} {stmt}")
-                print(f"{Fore.GREEN}Result:{Style.RESET_ALL}")
-                
-                # Format tabular results nicely
-                if isinstance(result, str) and '\n' in result:
-                    print(self._format_table_output(result))
-                else:
-                    print(result)
-                    
-                print(f"{Fore.GREEN}Execution time:{Style.RESET_ALL} {execution_time:.6f} seconds")
+                    self._print_result(result, execution_time)
             
             return True
         except Exception as e:
             print(f"{Fore.RED}Error executing script: {str(e)}{Style.RESET_ALL}")
             return False
 
+    def _print_result(self, result, execution_time, spacing=""):
+        """
+        Print a query result and its execution time with a single write.
+        
+        Args:
+            result: Query result, as returned by run_query
+            execution_time (float): Execution time in seconds
+            spacing (str): Text printed before and after the block
+        """
+        # Format tabular results nicely
+        if isinstance(result, str) and '\n' in result:
+            result = self._format_table_output(result)
+        
+        print(f"{spacing}{Fore.GREEN}Result:{Style.RESET_ALL}\n{result}\n"
+              f"{Fore.GREEN}Execution time:{Style.RESET_ALL} {execution_time:.6f} seconds{spacing}")
+    
     def _format_table_output(self, result):
         """Format tabular output with colors for better readability."""
         lines = result.split('\n')
@@ -150,7 +234,10 @@ class DBMSApplication:
         if tables:
             print(f"\n{Fore.GREEN}Available tables: {', '.join(tables)}{Style.RESET_ALL}")
         
-        # Setup readline for command history
+        # Setup readline for command history (only the CLI needs it, so
+        # script runs don't pay for the import)
+        import readline
+        
         histfile = os.path.join(os.path.expanduser("~"), ".minidbms_history")
         try:
             readline.read_history_file(histfile)
@@ -158,18 +245,29 @@ class DBMSApplication:
         except FileNotFoundError:
             pass
         
+        # input() would record every line itself; add them below instead,
+        # without blank lines or immediate repeats
+        readline.set_auto_history(False)
+        last_history = None
+        
         try:
             while True:
                 try:
-                    query = input(f"{Fore.CYAN}dbms>{Style.RESET_ALL} ")
-                    readline.add_history(query)
+                    query = input(f"{Fore.CYAN}dbms>{Style.RESET_ALL} ").strip()
+                    if query and query != last_history:
+                        readline.add_history(query)
+                        last_history = query
+                    
+                    # Commands are short, so only lowercase enough of the
+                    # input to tell them apart from (possibly long) SQL
+                    command = query[:7].lower()
                     
-                    if query.lower() in ('exit', 'quit'):
+                    if command in ('exit', 'quit'):
                         print(f"{Fore.YELLOW}Goodbye!{Style.RESET_ALL}")
                         break
-                    elif query.lower() == 'help':
+                    elif command == 'help':
                         self._print_help()
-                    elif query.lower() == 'tables':
+                    elif command == 'tables':
                         # Shortcut to list tables
                         tables = self.schema_manager.get_tables()
                         if tables:
@@ -180,21 +278,13 @@ class DBMSApplication:
                                 print(f"  {Fore.YELLOW}{table}{Style.RESET_ALL}: {', '.join(col_info)}")
                         else:
                             print(f"{Fore.YELLOW}No tables defined yet.{Style.RESET_ALL}")
-                    elif query.lower().startswith('run '):
+                    elif command.startswith('run '):
                         # Run script command
                         script_path = query[4:].strip()
                         self.run_script(script_path)
-                    elif query.strip():
+                    elif query:
                         result, execution_time = self.run_query(query)
-                        print(f"\n{Fore.GREEN}Result:{Style.RESET_ALL}")
-                        
-                        # Format tabular results nicely
-                        if isinstance(result, str) and '\n' in result:
-                            print(self._format_table_output(result))
-                        else:
-                            print(result)
-                        
-                        print(f"{Fore.GREEN}Execution time:{Style.RESET_ALL} {execution_time:.6f} seconds\n")
+                        self._print_result(result, execution_time, spacing="\n")
                 except KeyboardInterrupt:
                     print(f"\n{Fore.YELLOW}Use 'exit' or 'quit' to exit{Style.RESET_ALL}")
                 except Exception as e:
@@ -205,21 +295,7 @@ class DBMSApplication:
     
     def _print_help(self):
         """Print available commands and their descriptions."""
-        print(f"\n{Fore.YELLOW}Available SQL Commands:{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}CREATE TABLE{Style.RESET_ALL} table_name (column_name type [PRIMARY KEY], ...)")
-        print(f"  {Fore.GREEN}DROP TABLE{Style.RESET_ALL} table_name")
-        print(f"  {Fore.GREEN}CREATE INDEX ON{Style.RESET_ALL} table_name (column_name)")
-        print(f"  {Fore.GREEN}DROP INDEX ON{Style.RESET_ALL} table_name (column_name)")
-        print(f"  {Fore.GREEN}SELECT{Style.RESET_ALL} columns {Fore.GREEN}FROM{Style.RESET_ALL} table [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions] [{Fore.GREEN}ORDER BY{Style.RESET_ALL} columns] [{Fore.GREEN}HAVING{Style.RESET_ALL} condition]")
-        print(f"  {Fore.GREEN}INSERT INTO{Style.RESET_ALL} table_name {Fore.GREEN}VALUES{Style.RESET_ALL} (value1, value2, ...)")
-        print(f"  {Fore.GREEN}UPDATE{Style.RESET_ALL} table_name {Fore.GREEN}SET{Style.RESET_ALL} column=value [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions]")
-        print(f"  {Fore.GREEN}DELETE FROM{Style.RESET_ALL} table_name [{Fore.GREEN}WHERE{Style.RESET_ALL} conditions]")
-        
-        print(f"\n{Fore.YELLOW}Special Commands:{Style.RESET_ALL}")
-        print(f"  {Fore.CYAN}run{Style.RESET_ALL} <file_path> - Execute SQL statements from a file")
-        print(f"  {Fore.CYAN}tables{Style.RESET_ALL} - List all available tables and their columns")
-        print(f"  {Fore.CYAN}exit{Style.RESET_ALL}/{Fore.CYAN}quit{Style.RESET_ALL} - Exit the application")
-        print(f"  {Fore.CYAN}help{Style.RESET_ALL} - Show this help message\n")
+        print(HELP_TEXT)
 
 def parse_args():
     """Parse command-line arguments."""
@@ -227,6 +303,8 @@ def parse_args():
     parser.add_argument('--db-dir', default='./database', 
                         help='Directory to store database files')
     parser.add_argument('--script', help='SQL script file to execute')
+    parser.add_argument('--dedup', action='store_true',
+                        help='Skip repeated identical INSERT statements in the script')
     parser.add_argument('--demo', action='store_true', 
                         help='Load demo data and run sample queries')
     
@@ -280,6 +358,6 @@ if __name__ == "__main__":
         load_demo_data(app)
     
     if args.script:
-        app.run_script(args.script)
+        app.run_script(args.script, dedup=args.dedup)
     else:
         app.start_cli()
\ No newline at end of file
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDnonassocEQUALSNOTEQUALSLTGTLEGEAND AS ASC ASTERISK AVG BY COMMA COUNT CREATE DELETE DESC DESCRIBE DOT DROP EQUALS FOREIGN FROM GE GROUP GT HAVING IDENTIFIER IN INDEX INSERT INTEGER INTO JOIN KEY LE LIMIT LPAREN LT MAX MIN NOTEQUALS NUMBER OFFSET ON OR ORDER PRIMARY REFERENCES RPAREN SELECT SEMICOLON SET SHOW STRING STRING_LITERAL SUM TABLE TABLES UPDATE VALUES WHEREstatement : create_table_statement\n                     | drop_table_statement\n                     | create_index_statement\n                     | drop_index_statement\n                     | select_statement\n                     | insert_statement\n                     | update_statement\n                     | delete_statement\n                     | show_tables_statement\n                     | describe_statementshow_tables_statement : SHOW TABLESdescribe_statement : DESCRIBE IDENTIFIERcreate_table_statement : CREATE TABLE IDENTIFIER LPAREN column_def_list RPARENcolumn_def_list : column_def\n                          | column_def COMMA column_def_listcolumn_def : IDENTIFIER INTEGER primary_key_opt\n                      | IDENTIFIER STRING primary_key_opt\n                      | foreign_key_defprimary_key_opt : PRIMARY KEY\n                          | foreign_key_def : FOREIGN KEY LPAREN IDENTIFIER RPAREN REFERENCES IDENTIFIER LPAREN IDENTIFIER RPARENdrop_table_statement : DROP TABLE IDENTIFIERcreate_index_statement : CREATE INDEX ON IDENTIFIER LPAREN IDENTIFIER RPARENdrop_index_statement : DROP INDEX ON IDENTIFIER LPAREN IDENTIFIER RPARENselect_statement : SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt\n                           | SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause\n                           | SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause offset_clauseselect_list : ASTERISK\n                      | column_listcolumn_list : column_item\n                       | column_item COMMA column_listcolumn_item : IDENTIFIER\n                       | IDENTIFIER DOT IDENTIFIER\n                       | IDENTIFIER AS IDENTIFIER\n                       | IDENTIFIER DOT IDENTIFIER AS IDENTIFIER\n                       | aggregation_function\n                       | aggregation_function AS IDENTIFIERaggregation_function : IDENTIFIER LPAREN IDENTIFIER RPAREN\n                               | IDENTIFIER LPAREN ASTERISK RPAREN\n                               | COUNT LPAREN ASTERISK RPAREN\n                               | COUNT LPAREN IDENTIFIER RPAREN\n                               | AVG LPAREN IDENTIFIER RPAREN\n                               | SUM LPAREN IDENTIFIER RPAREN\n                               | MAX LPAREN IDENTIFIER RPAREN\n                               | MIN LPAREN IDENTIFIER RPARENtable_reference : IDENTIFIER\n                          | IDENTIFIER IDENTIFIER\n                          | IDENTIFIER AS IDENTIFIERjoin_clauses_opt : join_clause\n                           | join_clause join_clauses_opt\n                           | join_clause : JOIN IDENTIFIER ON join_condition\n                      | JOIN IDENTIFIER IDENTIFIER ON join_condition\n                      | JOIN IDENTIFIER AS IDENTIFIER ON join_conditionjoin_condition : IDENTIFIER DOT IDENTIFIER EQUALS IDENTIFIER DOT IDENTIFIERwhere_clause_opt : WHERE condition\n                           | group_by_clause_opt : GROUP BY column_list\n                              | subquery : SELECT select_list FROM table_reference where_clause_optcondition : simple_condition\n                     | condition AND condition\n                     | condition OR condition\n                     | LPAREN condition RPARENsimple_condition : comparison\n                           | subquery_conditionsubquery_condition : IDENTIFIER IN LPAREN subquery RPAREN\n                             | IDENTIFIER DOT IDENTIFIER IN LPAREN subquery RPARENcomparison : IDENTIFIER comp_operator expression\n                      | IDENTIFIER DOT IDENTIFIER comp_operator expressioncomp_operator : EQUALS\n                        | NOTEQUALS\n                        | LT\n                        | GT\n                        | LE\n                        | GEexpression : IDENTIFIER\n                     | NUMBER\n                     | STRING_LITERALorder_by_clause_opt : ORDER BY order_list\n                              | order_list : order_item\n                     | order_item COMMA order_listorder_item : IDENTIFIER\n                     | IDENTIFIER ASC\n                     | IDENTIFIER DESChaving_clause_opt : HAVING condition\n                            | limit_clause : LIMIT NUMBER\n                       | LIMIT NUMBER OFFSET NUMBERoffset_clause : OFFSET NUMBERinsert_statement : INSERT INTO IDENTIFIER VALUES LPAREN value_list RPARENvalue_list : expression\n                     | expression COMMA value_listupdate_statement : UPDATE IDENTIFIER SET set_list where_clause_optset_list : set_item\n                   | set_item COMMA set_listset_item : IDENTIFIER EQUALS expressiondelete_statement : DELETE FROM IDENTIFIER where_clause_opt'
+_lr_signature = 'leftORleftANDnonassocEQUALSNOTEQUALSLTGTLEGEAND AS ASC ASTERISK AVG BY COMMA COUNT CREATE DELETE DESC DESCRIBE DOT DROP EQUALS FOREIGN FROM GE GROUP GT HAVING IDENTIFIER IN INDEX INSERT INTEGER INTO JOIN KEY LE LIMIT LPAREN LT MAX MIN NOTEQUALS NUMBER OFFSET ON OR ORDER PRIMARY REFERENCES RPAREN SELECT SEMICOLON SET SHOW STRING STRING_LITERAL SUM TABLE TABLES UPDATE VALUES WHEREstatement : create_table_statement\n                     | drop_table_statement\n                     | create_index_statement\n                     | drop_index_statement\n                     | select_statement\n                     | insert_statement\n                     | update_statement\n                     | delete_statement\n                     | show_tables_statement\n                     | describe_statementshow_tables_statement : SHOW TABLESdescribe_statement : DESCRIBE IDENTIFIERcreate_table_statement : CREATE TABLE IDENTIFIER LPAREN column_def_list RPARENcolumn_def_list : column_def\n                          | column_def COMMA column_def_listcolumn_def : IDENTIFIER INTEGER primary_key_opt\n                      | IDENTIFIER STRING primary_key_opt\n                      | foreign_key_defprimary_key_opt : PRIMARY KEY\n                          | foreign_key_def : FOREIGN KEY LPAREN IDENTIFIER RPAREN REFERENCES IDENTIFIER LPAREN IDENTIFIER RPARENdrop_table_statement : DROP TABLE IDENTIFIERcreate_index_statement : CREATE INDEX ON IDENTIFIER LPAREN IDENTIFIER RPARENdrop_index_statement : DROP INDEX ON IDENTIFIER LPAREN IDENTIFIER RPARENselect_statement : SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt\n                           | SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause\n                           | SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause offset_clauseselect_list : ASTERISK\n                      | column_listcolumn_list : column_item\n                       | column_item COMMA column_listcolumn_item : IDENTIFIER\n                       | IDENTIFIER DOT IDENTIFIER\n                       | IDENTIFIER AS IDENTIFIER\n                       | IDENTIFIER DOT IDENTIFIER AS IDENTIFIER\n                       | aggregation_function\n                       | aggregation_function AS IDENTIFIERaggregation_function : IDENTIFIER LPAREN IDENTIFIER RPAREN\n                               | IDENTIFIER LPAREN ASTERISK RPAREN\n                               | COUNT LPAREN ASTERISK RPAREN\n                               | COUNT LPAREN IDENTIFIER RPAREN\n                               | AVG LPAREN IDENTIFIER RPAREN\n                               | SUM LPAREN IDENTIFIER RPAREN\n                               | MAX LPAREN IDENTIFIER RPAREN\n                               | MIN LPAREN IDENTIFIER RPARENtable_reference : IDENTIFIER\n                          | IDENTIFIER IDENTIFIER\n                          | IDENTIFIER AS IDENTIFIERjoin_clauses_opt : join_clause\n                           | join_clause join_clauses_opt\n                           | join_clause : JOIN IDENTIFIER ON join_condition\n                      | JOIN IDENTIFIER IDENTIFIER ON join_condition\n                      | JOIN IDENTIFIER AS IDENTIFIER ON join_conditionjoin_condition : IDENTIFIER DOT IDENTIFIER EQUALS IDENTIFIER DOT IDENTIFIERwhere_clause_opt : WHERE condition\n                           | group_by_clause_opt : GROUP BY column_list\n                              | subquery : SELECT select_list FROM table_reference where_clause_optcondition : simple_condition\n                     | condition AND condition\n                     | condition OR condition\n                     | LPAREN condition RPARENsimple_condition : comparison\n                           | subquery_conditionsubquery_condition : IDENTIFIER IN LPAREN subquery RPAREN\n                             | IDENTIFIER DOT IDENTIFIER IN LPAREN subquery RPARENcomparison : IDENTIFIER comp_operator expression\n                      | IDENTIFIER DOT IDENTIFIER comp_operator expressioncomp_operator : EQUALS\n                        | NOTEQUALS\n                        | LT\n                        | GT\n                        | LE\n                        | GEexpression : IDENTIFIER\n                     | NUMBER\n                     | STRING_LITERALorder_by_clause_opt : ORDER BY order_list\n                              | order_list : order_item\n                     | order_item COMMA order_listorder_item : IDENTIFIER\n                     | IDENTIFIER ASC\n                     | IDENTIFIER DESChaving_clause_opt : HAVING condition\n                            | limit_clause : LIMIT NUMBER\n                       | LIMIT NUMBER OFFSET NUMBERoffset_clause : OFFSET NUMBERinsert_statement : INSERT INTO IDENTIFIER VALUES row_listrow_list : LPAREN value_list RPAREN\n                    | row_list COMMA LPAREN value_list RPARENvalue_list : expression\n                     | expression COMMA value_listupdate_statement : UPDATE IDENTIFIER SET set_list where_clause_optset_list : set_item\n                   | set_item COMMA set_listset_item : IDENTIFIER EQUALS expressiondelete_statement : DELETE FROM IDENTIFIER where_clause_opt'
     
-_lr_action_items = {'CREATE':([0,],[12,]),'DROP':([0,],[13,]),'SELECT':([0,162,186,],[14,176,176,]),'INSERT':([0,],[15,]),'UPDATE':([0,],[16,]),'DELETE':([0,],[17,]),'SHOW':([0,],[18,]),'DESCRIBE':([0,],[19,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,27,28,29,38,39,42,57,61,62,63,64,65,68,77,78,79,88,89,91,94,95,96,97,98,99,100,101,104,106,107,109,110,114,119,120,122,123,124,127,128,129,130,148,149,150,155,157,158,159,160,165,170,178,181,182,185,187,190,192,193,194,195,197,201,203,205,206,208,211,213,217,220,],[0,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-30,-32,-36,-11,-12,-22,-57,-51,-46,-31,-33,-34,-37,-57,-96,-99,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-95,-56,-61,-65,-66,-13,-59,-50,-48,-35,-77,-78,-79,-98,-97,-23,-24,-81,-92,-62,-63,-64,-69,-88,-52,-25,-58,-53,-70,-67,-26,-87,-80,-82,-84,-54,-27,-89,-85,-86,-68,-91,-83,-90,-55,]),'TABLE':([12,13,],[20,22,]),'INDEX':([12,13,],[21,23,]),'ASTERISK':([14,48,50,176,],[25,67,69,25,]),'IDENTIFIER':([14,16,19,20,22,35,37,41,43,44,45,46,47,48,49,50,51,52,53,54,56,58,62,80,86,87,90,92,93,102,103,105,108,115,121,131,132,134,135,137,138,139,140,141,142,147,153,154,156,167,168,173,176,179,180,183,184,189,199,204,207,210,218,],[28,36,39,40,42,55,57,59,60,62,28,64,65,66,68,70,71,72,73,74,76,81,91,111,117,118,121,122,123,124,124,76,111,81,152,111,111,124,161,-71,-72,-73,-74,-75,-76,164,169,171,124,28,169,124,28,111,195,196,169,200,62,195,214,216,220,]),'COUNT':([14,45,167,176,],[30,30,30,30,]),'AVG':([14,45,167,176,],[31,31,31,31,]),'SUM':([14,45,167,176,],[32,32,32,32,]),'MAX':([14,45,167,176,],[33,33,33,33,]),'MIN':([14,45,167,176,],[34,34,34,34,]),'INTO':([15,],[35,]),'FROM':([17,24,25,26,27,28,29,63,64,65,68,94,95,96,97,98,99,100,101,123,188,],[37,44,-28,-29,-30,-32,-36,-31,-33,-34,-37,-38,-39,-40,-41,-42,-43,-44,-45,-35,199,]),'TABLES':([18,],[38,]),'ON':([21,23,121,152,171,],[41,43,153,168,184,]),'ORDER':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,106,107,109,110,119,120,122,123,124,127,128,150,157,158,159,160,170,181,182,185,187,197,208,220,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,166,-62,-63,-64,-69,-52,-58,-53,-70,-67,-54,-68,-55,]),'HAVING':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,106,107,109,110,119,120,122,123,124,127,128,150,157,158,159,160,165,170,181,182,185,187,193,194,195,197,205,206,208,213,220,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,-81,-62,-63,-64,-69,179,-52,-58,-53,-70,-67,-80,-82,-84,-54,-85,-86,-68,-83,-55,]),'LIMIT':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,106,107,109,110,119,120,122,123,124,127,128,150,157,158,159,160,165,170,178,181,182,185,187,192,193,194,195,197,205,206,208,213,220,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,-81,-62,-63,-64,-69,-88,-52,191,-58,-53,-70,-67,-87,-80,-82,-84,-54,-85,-86,-68,-83,-55,]),'COMMA':([27,28,29,64,65,68,78,83,84,94,95,96,97,98,99,100,101,112,113,123,124,126,127,128,129,143,145,163,194,195,205,206,219,],[45,-32,-36,-33,-34,-37,105,115,-18,-38,-39,-40,-41,-42,-43,-44,-45,-20,-20,-35,-77,156,-78,-79,-98,-16,-17,-19,204,-84,-85,-86,-21,]),'DOT':([28,111,169,214,],[46,135,183,218,]),'AS':([28,29,62,64,94,95,96,97,98,99,100,101,121,],[47,49,92,93,-38,-39,-40,-41,-42,-43,-44,-45,154,]),'LPAREN':([28,30,31,32,33,34,40,59,60,75,80,108,116,131,132,136,174,179,200,],[48,50,51,52,53,54,58,86,87,102,108,108,147,108,108,162,186,108,210,]),'SET':([36,],[56,]),'VALUES':([55,],[75,]),'WHERE':([57,61,62,77,78,88,89,91,120,122,124,127,128,129,130,170,182,197,209,220,],[80,-51,-46,80,-96,80,-49,-47,-50,-48,-77,-78,-79,-98,-97,-52,-53,-54,80,-55,]),'FOREIGN':([58,115,],[85,85,]),'GROUP':([61,62,88,89,91,106,107,109,110,119,120,122,124,127,128,157,158,159,160,170,182,185,187,197,208,220,],[-51,-46,-57,-49,-47,-56,-61,-65,-66,151,-50,-48,-77,-78,-79,-62,-63,-64,-69,-52,-53,-70,-67,-54,-68,-55,]),'JOIN':([61,62,89,91,122,170,182,197,220,],[90,-46,90,-47,-48,-52,-53,-54,-55,]),'RPAREN':([62,66,67,69,70,71,72,73,74,82,83,84,91,106,107,109,110,112,113,117,118,122,124,125,126,127,128,133,143,145,146,157,158,159,160,163,164,172,175,185,187,198,208,209,215,216,219,],[-46,94,95,96,97,98,99,100,101,114,-14,-18,-47,-56,-61,-65,-66,-20,-20,148,149,-48,-77,155,-93,-78,-79,159,-16,-17,-15,-62,-63,-64,-69,-19,177,-94,187,-70,-67,208,-68,-57,-60,219,-21,]),'EQUALS':([76,111,161,196,],[103,137,137,207,]),'INTEGER':([81,],[112,]),'STRING':([81,],[113,]),'KEY':([85,144,],[116,163,]),'NUMBER':([102,103,134,137,138,139,140,141,142,156,173,191,202,212,],[127,127,127,-71,-72,-73,-74,-75,-76,127,127,203,211,217,]),'STRING_LITERAL':([102,103,134,137,138,139,140,141,142,156,173,],[128,128,128,-71,-72,-73,-74,-75,-76,128,128,]),'AND':([106,107,109,110,124,127,128,133,157,158,159,160,185,187,192,208,],[131,-61,-65,-66,-77,-78,-79,131,-62,131,-64,-69,-70,-67,131,-68,]),'OR':([106,107,109,110,124,127,128,133,157,158,159,160,185,187,192,208,],[132,-61,-65,-66,-77,-78,-79,132,-62,-63,-64,-69,-70,-67,132,-68,]),'IN':([111,161,],[136,174,]),'NOTEQUALS':([111,161,],[138,138,]),'LT':([111,161,],[139,139,]),'GT':([111,161,],[140,140,]),'LE':([111,161,],[141,141,]),'GE':([111,161,],[142,142,]),'PRIMARY':([112,113,],[144,144,]),'BY':([151,166,],[167,180,]),'REFERENCES':([177,],[189,]),'OFFSET':([190,203,217,],[202,212,-90,]),'ASC':([195,],[205,]),'DESC':([195,],[206,]),}
+_lr_action_items = {'CREATE':([0,],[12,]),'DROP':([0,],[13,]),'SELECT':([0,165,191,],[14,180,180,]),'INSERT':([0,],[15,]),'UPDATE':([0,],[16,]),'DELETE':([0,],[17,]),'SHOW':([0,],[18,]),'DESCRIBE':([0,],[19,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,27,28,29,38,39,42,57,61,62,63,64,65,68,77,78,79,88,89,91,94,95,96,97,98,99,100,101,102,105,107,108,110,111,115,120,121,123,124,128,129,130,131,132,150,151,152,158,160,161,162,163,168,173,182,185,186,189,190,192,195,197,198,199,200,202,206,208,210,211,213,216,218,222,225,],[0,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-30,-32,-36,-11,-12,-22,-57,-51,-46,-31,-33,-34,-37,-57,-98,-101,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-92,-97,-56,-61,-65,-66,-13,-59,-50,-48,-35,-77,-78,-79,-100,-99,-23,-24,-81,-93,-62,-63,-64,-69,-88,-52,-25,-58,-53,-94,-70,-67,-26,-87,-80,-82,-84,-54,-27,-89,-85,-86,-68,-91,-83,-90,-55,]),'TABLE':([12,13,],[20,22,]),'INDEX':([12,13,],[21,23,]),'ASTERISK':([14,48,50,180,],[25,67,69,25,]),'IDENTIFIER':([14,16,19,20,22,35,37,41,43,44,45,46,47,48,49,50,51,52,53,54,56,58,62,80,86,87,90,92,93,103,104,106,109,116,122,133,134,136,137,139,140,141,142,143,144,149,155,156,157,159,170,171,177,180,183,184,187,188,194,204,209,212,215,223,],[28,36,39,40,42,55,57,59,60,62,28,64,65,66,68,70,71,72,73,74,76,81,91,112,118,119,122,123,124,128,128,76,112,81,154,112,112,128,164,-71,-72,-73,-74,-75,-76,167,172,174,128,128,28,172,128,28,112,200,201,172,205,62,200,219,221,225,]),'COUNT':([14,45,170,180,],[30,30,30,30,]),'AVG':([14,45,170,180,],[31,31,31,31,]),'SUM':([14,45,170,180,],[32,32,32,32,]),'MAX':([14,45,170,180,],[33,33,33,33,]),'MIN':([14,45,170,180,],[34,34,34,34,]),'INTO':([15,],[35,]),'FROM':([17,24,25,26,27,28,29,63,64,65,68,94,95,96,97,98,99,100,101,124,193,],[37,44,-28,-29,-30,-32,-36,-31,-33,-34,-37,-38,-39,-40,-41,-42,-43,-44,-45,-35,204,]),'TABLES':([18,],[38,]),'ON':([21,23,122,154,174,],[41,43,155,171,188,]),'ORDER':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,107,108,110,111,120,121,123,124,128,129,130,152,160,161,162,163,173,185,186,190,192,202,213,225,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,169,-62,-63,-64,-69,-52,-58,-53,-70,-67,-54,-68,-55,]),'HAVING':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,107,108,110,111,120,121,123,124,128,129,130,152,160,161,162,163,168,173,185,186,190,192,198,199,200,202,210,211,213,218,225,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,-81,-62,-63,-64,-69,183,-52,-58,-53,-70,-67,-80,-82,-84,-54,-85,-86,-68,-83,-55,]),'LIMIT':([27,28,29,61,62,63,64,65,68,88,89,91,94,95,96,97,98,99,100,101,107,108,110,111,120,121,123,124,128,129,130,152,160,161,162,163,168,173,182,185,186,190,192,197,198,199,200,202,210,211,213,218,225,],[-30,-32,-36,-51,-46,-31,-33,-34,-37,-57,-49,-47,-38,-39,-40,-41,-42,-43,-44,-45,-56,-61,-65,-66,-59,-50,-48,-35,-77,-78,-79,-81,-62,-63,-64,-69,-88,-52,196,-58,-53,-70,-67,-87,-80,-82,-84,-54,-85,-86,-68,-83,-55,]),'COMMA':([27,28,29,64,65,68,78,83,84,94,95,96,97,98,99,100,101,102,113,114,124,127,128,129,130,131,145,147,158,166,189,199,200,210,211,224,],[45,-32,-36,-33,-34,-37,106,116,-18,-38,-39,-40,-41,-42,-43,-44,-45,125,-20,-20,-35,159,-77,-78,-79,-100,-16,-17,-93,-19,-94,209,-84,-85,-86,-21,]),'DOT':([28,112,172,219,],[46,137,187,223,]),'AS':([28,29,62,64,94,95,96,97,98,99,100,101,122,],[47,49,92,93,-38,-39,-40,-41,-42,-43,-44,-45,156,]),'LPAREN':([28,30,31,32,33,34,40,59,60,75,80,109,117,125,133,134,138,178,183,205,],[48,50,51,52,53,54,58,86,87,103,109,109,149,157,109,109,165,191,109,215,]),'SET':([36,],[56,]),'VALUES':([55,],[75,]),'WHERE':([57,61,62,77,78,88,89,91,121,123,128,129,130,131,132,173,186,202,214,225,],[80,-51,-46,80,-98,80,-49,-47,-50,-48,-77,-78,-79,-100,-99,-52,-53,-54,80,-55,]),'FOREIGN':([58,116,],[85,85,]),'GROUP':([61,62,88,89,91,107,108,110,111,120,121,123,128,129,130,160,161,162,163,173,186,190,192,202,213,225,],[-51,-46,-57,-49,-47,-56,-61,-65,-66,153,-50,-48,-77,-78,-79,-62,-63,-64,-69,-52,-53,-70,-67,-54,-68,-55,]),'JOIN':([61,62,89,91,123,173,186,202,225,],[90,-46,90,-47,-48,-52,-53,-54,-55,]),'RPAREN':([62,66,67,69,70,71,72,73,74,82,83,84,91,107,108,110,111,113,114,118,119,123,126,127,128,129,130,135,145,147,148,160,161,162,163,166,167,175,176,179,190,192,203,213,214,220,221,224,],[-46,94,95,96,97,98,99,100,101,115,-14,-18,-47,-56,-61,-65,-66,-20,-20,150,151,-48,158,-95,-77,-78,-79,162,-16,-17,-15,-62,-63,-64,-69,-19,181,189,-96,192,-70,-67,213,-68,-57,-60,224,-21,]),'EQUALS':([76,112,164,201,],[104,139,139,212,]),'INTEGER':([81,],[113,]),'STRING':([81,],[114,]),'KEY':([85,146,],[117,166,]),'NUMBER':([103,104,136,139,140,141,142,143,144,157,159,177,196,207,217,],[129,129,129,-71,-72,-73,-74,-75,-76,129,129,129,208,216,222,]),'STRING_LITERAL':([103,104,136,139,140,141,142,143,144,157,159,177,],[130,130,130,-71,-72,-73,-74,-75,-76,130,130,130,]),'AND':([107,108,110,111,128,129,130,135,160,161,162,163,190,192,197,213,],[133,-61,-65,-66,-77,-78,-79,133,-62,133,-64,-69,-70,-67,133,-68,]),'OR':([107,108,110,111,128,129,130,135,160,161,162,163,190,192,197,213,],[134,-61,-65,-66,-77,-78,-79,134,-62,-63,-64,-69,-70,-67,134,-68,]),'IN':([112,164,],[138,178,]),'NOTEQUALS':([112,164,],[140,140,]),'LT':([112,164,],[141,141,]),'GT':([112,164,],[142,142,]),'LE':([112,164,],[143,143,]),'GE':([112,164,],[144,144,]),'PRIMARY':([113,114,],[146,146,]),'BY':([153,169,],[170,184,]),'REFERENCES':([181,],[194,]),'OFFSET':([195,208,222,],[207,217,-90,]),'ASC':([200,],[210,]),'DESC':([200,],[211,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'statement':([0,],[1,]),'create_table_statement':([0,],[2,]),'drop_table_statement':([0,],[3,]),'create_index_statement':([0,],[4,]),'drop_index_statement':([0,],[5,]),'select_statement':([0,],[6,]),'insert_statement':([0,],[7,]),'update_statement':([0,],[8,]),'delete_statement':([0,],[9,]),'show_tables_statement':([0,],[10,]),'describe_statement':([0,],[11,]),'select_list':([14,176,],[24,188,]),'column_list':([14,45,167,176,],[26,63,181,26,]),'column_item':([14,45,167,176,],[27,27,27,27,]),'aggregation_function':([14,45,167,176,],[29,29,29,29,]),'table_reference':([44,199,],[61,209,]),'set_list':([56,105,],[77,130,]),'set_item':([56,105,],[78,78,]),'where_clause_opt':([57,77,88,209,],[79,104,119,215,]),'column_def_list':([58,115,],[82,146,]),'column_def':([58,115,],[83,83,]),'foreign_key_def':([58,115,],[84,84,]),'join_clauses_opt':([61,89,],[88,120,]),'join_clause':([61,89,],[89,89,]),'condition':([80,108,131,132,179,],[106,133,157,158,192,]),'simple_condition':([80,108,131,132,179,],[107,107,107,107,107,]),'comparison':([80,108,131,132,179,],[109,109,109,109,109,]),'subquery_condition':([80,108,131,132,179,],[110,110,110,110,110,]),'value_list':([102,156,],[125,172,]),'expression':([102,103,134,156,173,],[126,129,160,126,185,]),'comp_operator':([111,161,],[134,173,]),'primary_key_opt':([112,113,],[143,145,]),'group_by_clause_opt':([119,],[150,]),'order_by_clause_opt':([150,],[165,]),'join_condition':([153,168,184,],[170,182,197,]),'subquery':([162,186,],[175,198,]),'having_clause_opt':([165,],[178,]),'limit_clause':([178,],[190,]),'order_list':([180,204,],[193,213,]),'order_item':([180,204,],[194,194,]),'offset_clause':([190,],[201,]),}
+_lr_goto_items = {'statement':([0,],[1,]),'create_table_statement':([0,],[2,]),'drop_table_statement':([0,],[3,]),'create_index_statement':([0,],[4,]),'drop_index_statement':([0,],[5,]),'select_statement':([0,],[6,]),'insert_statement':([0,],[7,]),'update_statement':([0,],[8,]),'delete_statement':([0,],[9,]),'show_tables_statement':([0,],[10,]),'describe_statement':([0,],[11,]),'select_list':([14,180,],[24,193,]),'column_list':([14,45,170,180,],[26,63,185,26,]),'column_item':([14,45,170,180,],[27,27,27,27,]),'aggregation_function':([14,45,170,180,],[29,29,29,29,]),'table_reference':([44,204,],[61,214,]),'set_list':([56,106,],[77,132,]),'set_item':([56,106,],[78,78,]),'where_clause_opt':([57,77,88,214,],[79,105,120,220,]),'column_def_list':([58,116,],[82,148,]),'column_def':([58,116,],[83,83,]),'foreign_key_def':([58,116,],[84,84,]),'join_clauses_opt':([61,89,],[88,121,]),'join_clause':([61,89,],[89,89,]),'row_list':([75,],[102,]),'condition':([80,109,133,134,183,],[107,135,160,161,197,]),'simple_condition':([80,109,133,134,183,],[108,108,108,108,108,]),'comparison':([80,109,133,134,183,],[110,110,110,110,110,]),'subquery_condition':([80,109,133,134,183,],[111,111,111,111,111,]),'value_list':([103,157,159,],[126,175,176,]),'expression':([103,104,136,157,159,177,],[127,131,163,127,127,190,]),'comp_operator':([112,164,],[136,177,]),'primary_key_opt':([113,114,],[145,147,]),'group_by_clause_opt':([120,],[152,]),'order_by_clause_opt':([152,],[168,]),'join_condition':([155,171,188,],[173,186,202,]),'subquery':([165,191,],[179,203,]),'having_clause_opt':([168,],[182,]),'limit_clause':([182,],[195,]),'order_list':([184,209,],[198,218,]),'order_item':([184,209,],[199,199,]),'offset_clause':([195,],[206,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,103 +27,105 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> statement","S'",1,None,None,None),
-  ('statement -> create_table_statement','statement',1,'p_statement','sql_parser.py',198),
-  ('statement -> drop_table_statement','statement',1,'p_statement','sql_parser.py',199),
-  ('statement -> create_index_statement','statement',1,'p_statement','sql_parser.py',200),
-  ('statement -> drop_index_statement','statement',1,'p_statement','sql_parser.py',201),
-  ('statement -> select_statement','statement',1,'p_statement','sql_parser.py',202),
-  ('statement -> insert_statement','statement',1,'p_statement','sql_parser.py',203),
-  ('statement -> update_statement','statement',1,'p_statement','sql_parser.py',204),
-  ('statement -> delete_statement','statement',1,'p_statement','sql_parser.py',205),
-  ('statement -> show_tables_statement','statement',1,'p_statement','sql_parser.py',206),
-  ('statement -> describe_statement','statement',1,'p_statement','sql_parser.py',207),
-  ('show_tables_statement -> SHOW TABLES','show_tables_statement',2,'p_show_tables_statement','sql_parser.py',211),
-  ('describe_statement -> DESCRIBE IDENTIFIER','describe_statement',2,'p_describe_statement','sql_parser.py',215),
-  ('create_table_statement -> CREATE TABLE IDENTIFIER LPAREN column_def_list RPAREN','create_table_statement',6,'p_create_table_statement','sql_parser.py',219),
-  ('column_def_list -> column_def','column_def_list',1,'p_column_def_list','sql_parser.py',251),
-  ('column_def_list -> column_def COMMA column_def_list','column_def_list',3,'p_column_def_list','sql_parser.py',252),
-  ('column_def -> IDENTIFIER INTEGER primary_key_opt','column_def',3,'p_column_def','sql_parser.py',259),
-  ('column_def -> IDENTIFIER STRING primary_key_opt','column_def',3,'p_column_def','sql_parser.py',260),
-  ('column_def -> foreign_key_def','column_def',1,'p_column_def','sql_parser.py',261),
-  ('primary_key_opt -> PRIMARY KEY','primary_key_opt',2,'p_primary_key_opt','sql_parser.py',280),
-  ('primary_key_opt -> <empty>','primary_key_opt',0,'p_primary_key_opt','sql_parser.py',281),
-  ('foreign_key_def -> FOREIGN KEY LPAREN IDENTIFIER RPAREN REFERENCES IDENTIFIER LPAREN IDENTIFIER RPAREN','foreign_key_def',10,'p_foreign_key_def','sql_parser.py',288),
-  ('drop_table_statement -> DROP TABLE IDENTIFIER','drop_table_statement',3,'p_drop_table_statement','sql_parser.py',297),
-  ('create_index_statement -> CREATE INDEX ON IDENTIFIER LPAREN IDENTIFIER RPAREN','create_index_statement',7,'p_create_index_statement','sql_parser.py',304),
-  ('drop_index_statement -> DROP INDEX ON IDENTIFIER LPAREN IDENTIFIER RPAREN','drop_index_statement',7,'p_drop_index_statement','sql_parser.py',312),
-  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt','select_statement',9,'p_select_statement','sql_parser.py',320),
-  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause','select_statement',10,'p_select_statement','sql_parser.py',321),
-  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause offset_clause','select_statement',11,'p_select_statement','sql_parser.py',322),
-  ('select_list -> ASTERISK','select_list',1,'p_select_list','sql_parser.py',344),
-  ('select_list -> column_list','select_list',1,'p_select_list','sql_parser.py',345),
-  ('column_list -> column_item','column_list',1,'p_column_list','sql_parser.py',352),
-  ('column_list -> column_item COMMA column_list','column_list',3,'p_column_list','sql_parser.py',353),
-  ('column_item -> IDENTIFIER','column_item',1,'p_column_item','sql_parser.py',360),
-  ('column_item -> IDENTIFIER DOT IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',361),
-  ('column_item -> IDENTIFIER AS IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',362),
-  ('column_item -> IDENTIFIER DOT IDENTIFIER AS IDENTIFIER','column_item',5,'p_column_item','sql_parser.py',363),
-  ('column_item -> aggregation_function','column_item',1,'p_column_item','sql_parser.py',364),
-  ('column_item -> aggregation_function AS IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',365),
-  ('aggregation_function -> IDENTIFIER LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',397),
-  ('aggregation_function -> IDENTIFIER LPAREN ASTERISK RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',398),
-  ('aggregation_function -> COUNT LPAREN ASTERISK RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',399),
-  ('aggregation_function -> COUNT LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',400),
-  ('aggregation_function -> AVG LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',401),
-  ('aggregation_function -> SUM LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',402),
-  ('aggregation_function -> MAX LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',403),
-  ('aggregation_function -> MIN LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',404),
-  ('table_reference -> IDENTIFIER','table_reference',1,'p_table_reference','sql_parser.py',416),
-  ('table_reference -> IDENTIFIER IDENTIFIER','table_reference',2,'p_table_reference','sql_parser.py',417),
-  ('table_reference -> IDENTIFIER AS IDENTIFIER','table_reference',3,'p_table_reference','sql_parser.py',418),
-  ('join_clauses_opt -> join_clause','join_clauses_opt',1,'p_join_clauses_opt','sql_parser.py',430),
-  ('join_clauses_opt -> join_clause join_clauses_opt','join_clauses_opt',2,'p_join_clauses_opt','sql_parser.py',431),
-  ('join_clauses_opt -> <empty>','join_clauses_opt',0,'p_join_clauses_opt','sql_parser.py',432),
-  ('join_clause -> JOIN IDENTIFIER ON join_condition','join_clause',4,'p_join_clause','sql_parser.py',444),
-  ('join_clause -> JOIN IDENTIFIER IDENTIFIER ON join_condition','join_clause',5,'p_join_clause','sql_parser.py',445),
-  ('join_clause -> JOIN IDENTIFIER AS IDENTIFIER ON join_condition','join_clause',6,'p_join_clause','sql_parser.py',446),
-  ('join_condition -> IDENTIFIER DOT IDENTIFIER EQUALS IDENTIFIER DOT IDENTIFIER','join_condition',7,'p_join_condition','sql_parser.py',469),
-  ('where_clause_opt -> WHERE condition','where_clause_opt',2,'p_where_clause_opt','sql_parser.py',478),
-  ('where_clause_opt -> <empty>','where_clause_opt',0,'p_where_clause_opt','sql_parser.py',479),
-  ('group_by_clause_opt -> GROUP BY column_list','group_by_clause_opt',3,'p_group_by_clause_opt','sql_parser.py',486),
-  ('group_by_clause_opt -> <empty>','group_by_clause_opt',0,'p_group_by_clause_opt','sql_parser.py',487),
-  ('subquery -> SELECT select_list FROM table_reference where_clause_opt','subquery',5,'p_subquery','sql_parser.py',494),
-  ('condition -> simple_condition','condition',1,'p_condition','sql_parser.py',503),
-  ('condition -> condition AND condition','condition',3,'p_condition','sql_parser.py',504),
-  ('condition -> condition OR condition','condition',3,'p_condition','sql_parser.py',505),
-  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition','sql_parser.py',506),
-  ('simple_condition -> comparison','simple_condition',1,'p_simple_condition','sql_parser.py',520),
-  ('simple_condition -> subquery_condition','simple_condition',1,'p_simple_condition','sql_parser.py',521),
-  ('subquery_condition -> IDENTIFIER IN LPAREN subquery RPAREN','subquery_condition',5,'p_subquery_condition','sql_parser.py',525),
-  ('subquery_condition -> IDENTIFIER DOT IDENTIFIER IN LPAREN subquery RPAREN','subquery_condition',7,'p_subquery_condition','sql_parser.py',526),
-  ('comparison -> IDENTIFIER comp_operator expression','comparison',3,'p_comparison','sql_parser.py',541),
-  ('comparison -> IDENTIFIER DOT IDENTIFIER comp_operator expression','comparison',5,'p_comparison','sql_parser.py',542),
-  ('comp_operator -> EQUALS','comp_operator',1,'p_comp_operator','sql_parser.py',559),
-  ('comp_operator -> NOTEQUALS','comp_operator',1,'p_comp_operator','sql_parser.py',560),
-  ('comp_operator -> LT','comp_operator',1,'p_comp_operator','sql_parser.py',561),
-  ('comp_operator -> GT','comp_operator',1,'p_comp_operator','sql_parser.py',562),
-  ('comp_operator -> LE','comp_operator',1,'p_comp_operator','sql_parser.py',563),
-  ('comp_operator -> GE','comp_operator',1,'p_comp_operator','sql_parser.py',564),
-  ('expression -> IDENTIFIER','expression',1,'p_expression','sql_parser.py',568),
-  ('expression -> NUMBER','expression',1,'p_expression','sql_parser.py',569),
-  ('expression -> STRING_LITERAL','expression',1,'p_expression','sql_parser.py',570),
-  ('order_by_clause_opt -> ORDER BY order_list','order_by_clause_opt',3,'p_order_by_clause_opt','sql_parser.py',579),
-  ('order_by_clause_opt -> <empty>','order_by_clause_opt',0,'p_order_by_clause_opt','sql_parser.py',580),
-  ('order_list -> order_item','order_list',1,'p_order_list','sql_parser.py',587),
-  ('order_list -> order_item COMMA order_list','order_list',3,'p_order_list','sql_parser.py',588),
-  ('order_item -> IDENTIFIER','order_item',1,'p_order_item','sql_parser.py',595),
-  ('order_item -> IDENTIFIER ASC','order_item',2,'p_order_item','sql_parser.py',596),
-  ('order_item -> IDENTIFIER DESC','order_item',2,'p_order_item','sql_parser.py',597),
-  ('having_clause_opt -> HAVING condition','having_clause_opt',2,'p_having_clause_opt','sql_parser.py',604),
-  ('having_clause_opt -> <empty>','having_clause_opt',0,'p_having_clause_opt','sql_parser.py',605),
-  ('limit_clause -> LIMIT NUMBER','limit_clause',2,'p_limit_clause','sql_parser.py',612),
-  ('limit_clause -> LIMIT NUMBER OFFSET NUMBER','limit_clause',4,'p_limit_clause','sql_parser.py',613),
-  ('offset_clause -> OFFSET NUMBER','offset_clause',2,'p_offset_clause','sql_parser.py',622),
-  ('insert_statement -> INSERT INTO IDENTIFIER VALUES LPAREN value_list RPAREN','insert_statement',7,'p_insert_statement','sql_parser.py',626),
-  ('value_list -> expression','value_list',1,'p_value_list','sql_parser.py',634),
-  ('value_list -> expression COMMA value_list','value_list',3,'p_value_list','sql_parser.py',635),
-  ('update_statement -> UPDATE IDENTIFIER SET set_list where_clause_opt','update_statement',5,'p_update_statement','sql_parser.py',642),
-  ('set_list -> set_item','set_list',1,'p_set_list','sql_parser.py',651),
-  ('set_list -> set_item COMMA set_list','set_list',3,'p_set_list','sql_parser.py',652),
-  ('set_item -> IDENTIFIER EQUALS expression','set_item',3,'p_set_item','sql_parser.py',659),
-  ('delete_statement -> DELETE FROM IDENTIFIER where_clause_opt','delete_statement',4,'p_delete_statement','sql_parser.py',666),
+  ('statement -> create_table_statement','statement',1,'p_statement','sql_parser.py',216),
+  ('statement -> drop_table_statement','statement',1,'p_statement','sql_parser.py',217),
+  ('statement -> create_index_statement','statement',1,'p_statement','sql_parser.py',218),
+  ('statement -> drop_index_statement','statement',1,'p_statement','sql_parser.py',219),
+  ('statement -> select_statement','statement',1,'p_statement','sql_parser.py',220),
+  ('statement -> insert_statement','statement',1,'p_statement','sql_parser.py',221),
+  ('statement -> update_statement','statement',1,'p_statement','sql_parser.py',222),
+  ('statement -> delete_statement','statement',1,'p_statement','sql_parser.py',223),
+  ('statement -> show_tables_statement','statement',1,'p_statement','sql_parser.py',224),
+  ('statement -> describe_statement','statement',1,'p_statement','sql_parser.py',225),
+  ('show_tables_statement -> SHOW TABLES','show_tables_statement',2,'p_show_tables_statement','sql_parser.py',229),
+  ('describe_statement -> DESCRIBE IDENTIFIER','describe_statement',2,'p_describe_statement','sql_parser.py',233),
+  ('create_table_statement -> CREATE TABLE IDENTIFIER LPAREN column_def_list RPAREN','create_table_statement',6,'p_create_table_statement','sql_parser.py',237),
+  ('column_def_list -> column_def','column_def_list',1,'p_column_def_list','sql_parser.py',269),
+  ('column_def_list -> column_def COMMA column_def_list','column_def_list',3,'p_column_def_list','sql_parser.py',270),
+  ('column_def -> IDENTIFIER INTEGER primary_key_opt','column_def',3,'p_column_def','sql_parser.py',277),
+  ('column_def -> IDENTIFIER STRING primary_key_opt','column_def',3,'p_column_def','sql_parser.py',278),
+  ('column_def -> foreign_key_def','column_def',1,'p_column_def','sql_parser.py',279),
+  ('primary_key_opt -> PRIMARY KEY','primary_key_opt',2,'p_primary_key_opt','sql_parser.py',298),
+  ('primary_key_opt -> <empty>','primary_key_opt',0,'p_primary_key_opt','sql_parser.py',299),
+  ('foreign_key_def -> FOREIGN KEY LPAREN IDENTIFIER RPAREN REFERENCES IDENTIFIER LPAREN IDENTIFIER RPAREN','foreign_key_def',10,'p_foreign_key_def','sql_parser.py',306),
+  ('drop_table_statement -> DROP TABLE IDENTIFIER','drop_table_statement',3,'p_drop_table_statement','sql_parser.py',315),
+  ('create_index_statement -> CREATE INDEX ON IDENTIFIER LPAREN IDENTIFIER RPAREN','create_index_statement',7,'p_create_index_statement','sql_parser.py',322),
+  ('drop_index_statement -> DROP INDEX ON IDENTIFIER LPAREN IDENTIFIER RPAREN','drop_index_statement',7,'p_drop_index_statement','sql_parser.py',330),
+  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt','select_statement',9,'p_select_statement','sql_parser.py',338),
+  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause','select_statement',10,'p_select_statement','sql_parser.py',339),
+  ('select_statement -> SELECT select_list FROM table_reference join_clauses_opt where_clause_opt group_by_clause_opt order_by_clause_opt having_clause_opt limit_clause offset_clause','select_statement',11,'p_select_statement','sql_parser.py',340),
+  ('select_list -> ASTERISK','select_list',1,'p_select_list','sql_parser.py',362),
+  ('select_list -> column_list','select_list',1,'p_select_list','sql_parser.py',363),
+  ('column_list -> column_item','column_list',1,'p_column_list','sql_parser.py',370),
+  ('column_list -> column_item COMMA column_list','column_list',3,'p_column_list','sql_parser.py',371),
+  ('column_item -> IDENTIFIER','column_item',1,'p_column_item','sql_parser.py',378),
+  ('column_item -> IDENTIFIER DOT IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',379),
+  ('column_item -> IDENTIFIER AS IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',380),
+  ('column_item -> IDENTIFIER DOT IDENTIFIER AS IDENTIFIER','column_item',5,'p_column_item','sql_parser.py',381),
+  ('column_item -> aggregation_function','column_item',1,'p_column_item','sql_parser.py',382),
+  ('column_item -> aggregation_function AS IDENTIFIER','column_item',3,'p_column_item','sql_parser.py',383),
+  ('aggregation_function -> IDENTIFIER LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',415),
+  ('aggregation_function -> IDENTIFIER LPAREN ASTERISK RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',416),
+  ('aggregation_function -> COUNT LPAREN ASTERISK RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',417),
+  ('aggregation_function -> COUNT LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',418),
+  ('aggregation_function -> AVG LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',419),
+  ('aggregation_function -> SUM LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',420),
+  ('aggregation_function -> MAX LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',421),
+  ('aggregation_function -> MIN LPAREN IDENTIFIER RPAREN','aggregation_function',4,'p_aggregation_function','sql_parser.py',422),
+  ('table_reference -> IDENTIFIER','table_reference',1,'p_table_reference','sql_parser.py',434),
+  ('table_reference -> IDENTIFIER IDENTIFIER','table_reference',2,'p_table_reference','sql_parser.py',435),
+  ('table_reference -> IDENTIFIER AS IDENTIFIER','table_reference',3,'p_table_reference','sql_parser.py',436),
+  ('join_clauses_opt -> join_clause','join_clauses_opt',1,'p_join_clauses_opt','sql_parser.py',448),
+  ('join_clauses_opt -> join_clause join_clauses_opt','join_clauses_opt',2,'p_join_clauses_opt','sql_parser.py',449),
+  ('join_clauses_opt -> <empty>','join_clauses_opt',0,'p_join_clauses_opt','sql_parser.py',450),
+  ('join_clause -> JOIN IDENTIFIER ON join_condition','join_clause',4,'p_join_clause','sql_parser.py',462),
+  ('join_clause -> JOIN IDENTIFIER IDENTIFIER ON join_condition','join_clause',5,'p_join_clause','sql_parser.py',463),
+  ('join_clause -> JOIN IDENTIFIER AS IDENTIFIER ON join_condition','join_clause',6,'p_join_clause','sql_parser.py',464),
+  ('join_condition -> IDENTIFIER DOT IDENTIFIER EQUALS IDENTIFIER DOT IDENTIFIER','join_condition',7,'p_join_condition','sql_parser.py',487),
+  ('where_clause_opt -> WHERE condition','where_clause_opt',2,'p_where_clause_opt','sql_parser.py',496),
+  ('where_clause_opt -> <empty>','where_clause_opt',0,'p_where_clause_opt','sql_parser.py',497),
+  ('group_by_clause_opt -> GROUP BY column_list','group_by_clause_opt',3,'p_group_by_clause_opt','sql_parser.py',504),
+  ('group_by_clause_opt -> <empty>','group_by_clause_opt',0,'p_group_by_clause_opt','sql_parser.py',505),
+  ('subquery -> SELECT select_list FROM table_reference where_clause_opt','subquery',5,'p_subquery','sql_parser.py',512),
+  ('condition -> simple_condition','condition',1,'p_condition','sql_parser.py',521),
+  ('condition -> condition AND condition','condition',3,'p_condition','sql_parser.py',522),
+  ('condition -> condition OR condition','condition',3,'p_condition','sql_parser.py',523),
+  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition','sql_parser.py',524),
+  ('simple_condition -> comparison','simple_condition',1,'p_simple_condition','sql_parser.py',538),
+  ('simple_condition -> subquery_condition','simple_condition',1,'p_simple_condition','sql_parser.py',539),
+  ('subquery_condition -> IDENTIFIER IN LPAREN subquery RPAREN','subquery_condition',5,'p_subquery_condition','sql_parser.py',543),
+  ('subquery_condition -> IDENTIFIER DOT IDENTIFIER IN LPAREN subquery RPAREN','subquery_condition',7,'p_subquery_condition','sql_parser.py',544),
+  ('comparison -> IDENTIFIER comp_operator expression','comparison',3,'p_comparison','sql_parser.py',559),
+  ('comparison -> IDENTIFIER DOT IDENTIFIER comp_operator expression','comparison',5,'p_comparison','sql_parser.py',560),
+  ('comp_operator -> EQUALS','comp_operator',1,'p_comp_operator','sql_parser.py',577),
+  ('comp_operator -> NOTEQUALS','comp_operator',1,'p_comp_operator','sql_parser.py',578),
+  ('comp_operator -> LT','comp_operator',1,'p_comp_operator','sql_parser.py',579),
+  ('comp_operator -> GT','comp_operator',1,'p_comp_operator','sql_parser.py',580),
+  ('comp_operator -> LE','comp_operator',1,'p_comp_operator','sql_parser.py',581),
+  ('comp_operator -> GE','comp_operator',1,'p_comp_operator','sql_parser.py',582),
+  ('expression -> IDENTIFIER','expression',1,'p_expression','sql_parser.py',586),
+  ('expression -> NUMBER','expression',1,'p_expression','sql_parser.py',587),
+  ('expression -> STRING_LITERAL','expression',1,'p_expression','sql_parser.py',588),
+  ('order_by_clause_opt -> ORDER BY order_list','order_by_clause_opt',3,'p_order_by_clause_opt','sql_parser.py',597),
+  ('order_by_clause_opt -> <empty>','order_by_clause_opt',0,'p_order_by_clause_opt','sql_parser.py',598),
+  ('order_list -> order_item','order_list',1,'p_order_list','sql_parser.py',605),
+  ('order_list -> order_item COMMA order_list','order_list',3,'p_order_list','sql_parser.py',606),
+  ('order_item -> IDENTIFIER','order_item',1,'p_order_item','sql_parser.py',613),
+  ('order_item -> IDENTIFIER ASC','order_item',2,'p_order_item','sql_parser.py',614),
+  ('order_item -> IDENTIFIER DESC','order_item',2,'p_order_item','sql_parser.py',615),
+  ('having_clause_opt -> HAVING condition','having_clause_opt',2,'p_having_clause_opt','sql_parser.py',622),
+  ('having_clause_opt -> <empty>','having_clause_opt',0,'p_having_clause_opt','sql_parser.py',623),
+  ('limit_clause -> LIMIT NUMBER','limit_clause',2,'p_limit_clause','sql_parser.py',630),
+  ('limit_clause -> LIMIT NUMBER OFFSET NUMBER','limit_clause',4,'p_limit_clause','sql_parser.py',631),
+  ('offset_clause -> OFFSET NUMBER','offset_clause',2,'p_offset_clause','sql_parser.py',640),
+  ('insert_statement -> INSERT INTO IDENTIFIER VALUES row_list','insert_statement',5,'p_insert_statement','sql_parser.py',644),
+  ('row_list -> LPAREN value_list RPAREN','row_list',3,'p_row_list','sql_parser.py',656),
+  ('row_list -> row_list COMMA LPAREN value_list RPAREN','row_list',5,'p_row_list','sql_parser.py',657),
+  ('value_list -> expression','value_list',1,'p_value_list','sql_parser.py',665),
+  ('value_list -> expression COMMA value_list','value_list',3,'p_value_list','sql_parser.py',666),
+  ('update_statement -> UPDATE IDENTIFIER SET set_list where_clause_opt','update_statement',5,'p_update_statement','sql_parser.py',673),
+  ('set_list -> set_item','set_list',1,'p_set_list','sql_parser.py',682),
+  ('set_list -> set_item COMMA set_list','set_list',3,'p_set_list','sql_parser.py',683),
+  ('set_item -> IDENTIFIER EQUALS expression','set_item',3,'p_set_item','sql_parser.py',690),
+  ('delete_statement -> DELETE FROM IDENTIFIER where_clause_opt','delete_statement',4,'p_delete_statement','sql_parser.py',697),
 ]
@@ -6,11 +6,17 @@ using the PLY (Python Lex-Yacc) library for the DBMS implementation project.
 """
 
 import os
+import re
+import sys
 import ply.lex as lex
 import ply.yacc as yacc
 from common.exceptions import ParseError, ValidationError
 from common.types import DataType
 
+# String literals (so quoted semicolons are skipped), a statement separator,
+# or the opening quote of a literal that is not closed yet
+_STATEMENT_SPLIT = re.compile(r"'[^']*'|\"[^\"]*\"|;|['\"]")
+
 class SQLParser:
     """
     SQL Parser class that converts SQL strings into structured representations
@@ -61,6 +67,7 @@ class SQLParser:
         
     def t_NOTEQUALS(self, t):
         r'!=|<>'
+        t.value = sys.intern(t.value)
         return self.track_token(t)
         
     def t_LT(self, t):
@@ -73,10 +80,12 @@ class SQLParser:
         
     def t_LE(self, t):
         r'<='
+        t.value = sys.intern(t.value)
         return self.track_token(t)
         
     def t_GE(self, t):
         r'>='
+        t.value = sys.intern(t.value)
         return self.track_token(t)
         
     def t_ASTERISK(self, t):
@@ -141,6 +150,8 @@ class SQLParser:
             # Check for normal reserved words
             t.type = self.reserved.get(t.value.lower(), 'IDENTIFIER')
         
+        # Names recur in every statement; share one string object per name
+        t.value = sys.intern(t.value)
         return self.track_token(t)
     
     def t_NUMBER(self, t):
@@ -166,11 +177,20 @@ class SQLParser:
     def t_error(self, t):
         raise ParseError(f"Illegal character '{t.value[0]}'")
     
+    # Lexer built by the first SQLParser; later instances clone it
+    _lexer_template = None
+    
     # Build the lexer
     def build_lexer(self):
         # Store parser output directory for PLY
         self.output_dir = os.path.dirname(os.path.abspath(__file__))
-        self.lexer = lex.lex(module=self, outputdir=self.output_dir, optimize=0, debug=0)
+        
+        # Validating the token rules and compiling the master regex is the
+        # slow part, so only do it once per process. clone() rebinds the
+        # rule methods to this instance.
+        if SQLParser._lexer_template is None:
+            SQLParser._lexer_template = lex.lex(module=self, outputdir=self.output_dir, optimize=0, debug=0)
+        self.lexer = SQLParser._lexer_template.clone(self)
         self.lexer.last_token_type = None
     
     # Define operator precedence and associativity
@@ -378,13 +398,13 @@ class SQLParser:
         elif len(p) == 6:  # Qualified column with alias
             p[0] = {
                 'type': 'column',
-                'name': f"{p[1]}.{p[3]}",
+                'name': sys.intern(f"{p[1]}.{p[3]}"),
                 'alias': p[5]
             }
         elif len(p) > 2 and p[2] == '.':  # Qualified column (table.column)
             p[0] = {
                 'type': 'column',
-                'name': f"{p[1]}.{p[3]}"
+                'name': sys.intern(f"{p[1]}.{p[3]}")
             }
         else:  # Simple column
             p[0] = {
@@ -532,7 +552,7 @@ class SQLParser:
         elif len(p) == 8:  # Qualified column with IN subquery
             p[0] = {
                 'type': 'in_subquery',
-                'column': {'type': 'column', 'name': f"{p[1]}.{p[3]}"},
+                'column': {'type': 'column', 'name': sys.intern(f"{p[1]}.{p[3]}")},
                 'subquery': p[6]
             }
     
@@ -542,7 +562,7 @@ class SQLParser:
         if len(p) > 4:  # Qualified column
             p[0] = {
                 'type': 'comparison',
-                'left': {'type': 'column', 'name': f"{p[1]}.{p[3]}"},
+                'left': {'type': 'column', 'name': sys.intern(f"{p[1]}.{p[3]}")},
                 'operator': p[4],
                 'right': p[5]
             }
@@ -622,12 +642,25 @@ class SQLParser:
         p[0] = p[2]
     
     def p_insert_statement(self, p):
-        'insert_statement : INSERT INTO IDENTIFIER VALUES LPAREN value_list RPAREN'
+        'insert_statement : INSERT INTO IDENTIFIER VALUES row_list'
         p[0] = {
             'type': 'INSERT',
             'table_name': p[3],
-            'values': p[6]
+            'values': p[5][0]
         }
+        
+        # Multi-row INSERT: "values" holds the first row, "rows" all of them
+        if len(p[5]) > 1:
+            p[0]['rows'] = p[5]
+    
+    def p_row_list(self, p):
+        '''row_list : LPAREN value_list RPAREN
+                    | row_list COMMA LPAREN value_list RPAREN'''
+        if len(p) == 4:
+            p[0] = [p[2]]
+        else:
+            p[1].append(p[4])
+            p[0] = p[1]
     
     def p_value_list(self, p):
         '''value_list : expression
@@ -782,6 +815,99 @@ class SQLParser:
                 raise
             raise ParseError(f"Error parsing query: {str(e)}")
     
+    @staticmethod
+    def iter_statements(text):
+        """
+        Yield the SQL statements of a batch one at a time.
+        
+        Semicolons inside string literals do not end a statement. The text
+        is scanned lazily, so a caller can start on the first statement
+        before the rest has been split; empty statements are skipped.
+        
+        Args:
+            text (str): One or more SQL statements
+            
+        Yields:
+            str: Each statement, stripped
+        """
+        start = 0
+        for match in _STATEMENT_SPLIT.finditer(text):
+            if match.group() == ";":
+                stmt = text[start:match.start()].strip()
+                if stmt:
+                    yield stmt
+                start = match.end()
+        
+        stmt = text[start:].strip()
+        if stmt:
+            yield stmt
+    
+    @staticmethod
+    def split_statements(text):
+        """
+        Split a batch of SQL statements on the semicolons between them.
+        
+        Args:
+            text (str): One or more SQL statements
+            
+        Returns:
+            list: The individual statements, stripped
+        """
+        return list(SQLParser.iter_statements(text))
+    
+    @staticmethod
+    def iter_statements_from_stream(stream, chunk_size=65536):
+        """
+        Yield the SQL statements read from a file-like object.
+        
+        The stream is read in chunks and only the unfinished statement is
+        kept between them, so memory grows with the longest statement
+        rather than with the whole script.
+        
+        Args:
+            stream: Text stream with a read(size) method
+            chunk_size (int): Number of characters to read at a time
+            
+        Yields:
+            str: Each statement, stripped
+        """
+        pending = ""
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            
+            pending += chunk
+            start = 0
+            for match in _STATEMENT_SPLIT.finditer(pending):
+                token = match.group()
+                if token == ";":
+                    stmt = pending[start:match.start()].strip()
+                    if stmt:
+                        yield stmt
+                    start = match.end()
+                elif len(token) == 1:
+                    # The literal continues in the next chunk
+                    break
+            pending = pending[start:]
+        
+        yield from SQLParser.iter_statements(pending)
+    
+    def parse_batch(self, text):
+        """
+        Parse every statement in a semicolon-separated batch.
+        
+        Args:
+            text (str): One or more SQL statements
+            
+        Returns:
+            list: Structured representations, in statement order
+            
+        Raises:
+            ParseError: If any statement cannot be parsed
+        """
+        return [self.parse(stmt) for stmt in self.split_statements(text)]
+    
     def validate(self, parsed_query, schema_manager):
         """
         Validate a parsed query against the database schema.
@@ -888,35 +1014,40 @@ class SQLParser:
         if not schema_manager.table_exists(table_name):
             raise ValidationError(f"Table '{table_name}' does not exist")
         
-        # Check number of values matches number of columns
         columns = schema_manager.get_columns(table_name)
-        if len(parsed_query["values"]) != len(columns):
-            raise ValidationError(f"INSERT has {len(parsed_query['values'])} values but table '{table_name}' has {len(columns)} columns")
-        
-        # Check data types
-        for i, (value, column) in enumerate(zip(parsed_query["values"], columns)):
-            if value["type"] == "integer" and column["type"] != DataType.INTEGER:
-                raise ValidationError(f"Type mismatch for column {i+1}: expected STRING, got INTEGER")
-            elif value["type"] == "string" and column["type"] != DataType.STRING:
-                raise ValidationError(f"Type mismatch for column {i+1}: expected INTEGER, got STRING")
-        
-        # Check primary key constraint if applicable
         primary_key = schema_manager.get_primary_key(table_name)
-        if primary_key:
-            pk_index = next(i for i, col in enumerate(columns) if col["name"] == primary_key)
-            pk_value = parsed_query["values"][pk_index]["value"]
-            
-            if schema_manager.primary_key_exists(table_name, pk_value):
-                raise ValidationError(f"Duplicate primary key value: {pk_value}")
-        
-        # Check foreign key constraints if applicable
         foreign_keys = schema_manager.get_foreign_keys(table_name)
-        for fk_column, fk_ref in foreign_keys.items():
-            fk_index = next(i for i, col in enumerate(columns) if col["name"] == fk_column)
-            fk_value = parsed_query["values"][fk_index]["value"]
+        seen_keys = set()
+        
+        for values in parsed_query.get("rows", [parsed_query["values"]]):
+            # Check number of values matches number of columns
+            if len(values) != len(columns):
+                raise ValidationError(f"INSERT has {len(values)} values but table '{table_name}' has {len(columns)} columns")
+            
+            # Check data types
+            for i, (value, column) in enumerate(zip(values, columns)):
+                if value["type"] == "integer" and column["type"] != DataType.INTEGER:
+                    raise ValidationError(f"Type mismatch for column {i+1}: expected STRING, got INTEGER")
+                elif value["type"] == "string" and column["type"] != DataType.STRING:
+                    raise ValidationError(f"Type mismatch for column {i+1}: expected INTEGER, got STRING")
             
-            if not schema_manager.foreign_key_exists(fk_ref["table"], fk_ref["column"], fk_value):
-                raise ValidationError(f"Foreign key constraint violation: {fk_value} does not exist in {fk_ref['table']}.{fk_ref['column']}")
+            # Check primary key constraint if applicable, including
+            # duplicates between rows of the same statement
+            if primary_key:
+                pk_index = next(i for i, col in enumerate(columns) if col["name"] == primary_key)
+                pk_value = values[pk_index]["value"]
+                
+                if pk_value in seen_keys or schema_manager.primary_key_exists(table_name, pk_value):
+                    raise ValidationError(f"Duplicate primary key value: {pk_value}")
+                seen_keys.add(pk_value)
+            
+            # Check foreign key constraints if applicable
+            for fk_column, fk_ref in foreign_keys.items():
+                fk_index = next(i for i, col in enumerate(columns) if col["name"] == fk_column)
+                fk_value = values[fk_index]["value"]
+                
+                if not schema_manager.foreign_key_exists(fk_ref["table"], fk_ref["column"], fk_value):
+                    raise ValidationError(f"Foreign key constraint violation: {fk_value} does not exist in {fk_ref['table']}.{fk_ref['column']}")
     
     def _validate_update(self, parsed_query, schema_manager):
         """Validate UPDATE query."""
@@ -2,11 +2,184 @@
 Query Optimizer Module
 
 This module handles query optimization, including:
-- Join method selection (sort-merge vs. nested-loop)
+- Join method selection (hash, sort-merge or index nested-loop)
 - Condition ordering optimization
 - Query tree transformation
+- Compiling WHERE conditions into Python functions
 """
 
+from functools import lru_cache
+
+# Operator to use when the two sides of a comparison are swapped
+REVERSED_OPERATORS = {
+    "=": "=",
+    "!=": "!=",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+# Python spelling of each SQL comparison operator
+PYTHON_OPERATORS = {
+    "=": "==",
+    "!=": "!=",
+    "<>": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+}
+
+def _predicate_key(node):
+    """Build a canonical string for a condition node, used to order operands."""
+    node_type = node.get("type")
+    
+    if node_type == "comparison":
+        left, right = node["left"], node["right"]
+        left_str = left.get("name", left.get("value"))
+        right_str = right.get("name", right.get("value"))
+        return f"{left_str} {node['operator']} {right_str!r}"
+    if node_type in ("and", "or"):
+        return f"{node_type}({_predicate_key(node['left'])}, {_predicate_key(node['right'])})"
+    return repr(node)
+
+def normalize_predicate(node):
+    """
+    Rewrite a WHERE tree into a canonical form.
+    
+    - "value op column" comparisons become "column op' value"
+    - "<>" is spelled "!="
+    - AND/OR operands are put in a fixed order, with plain comparisons
+      before subquery conditions
+    
+    Equivalent conditions therefore produce identical trees. The input is
+    not modified; comparison and AND/OR nodes are rebuilt.
+    
+    Args:
+        node (dict): The condition to normalize
+        
+    Returns:
+        dict: The normalized condition
+    """
+    if not node:
+        return node
+    
+    node_type = node.get("type")
+    
+    if node_type == "comparison":
+        left, right = node["left"], node["right"]
+        operator = "!=" if node["operator"] == "<>" else node["operator"]
+        
+        # Keep the column on the left, where selectivity estimation expects it
+        if left.get("type") != "column" and right.get("type") == "column":
+            left, right = right, left
+            operator = REVERSED_OPERATORS[operator]
+        
+        return {"type": "comparison", "left": left, "operator": operator, "right": right}
+    
+    if node_type in ("and", "or"):
+        operands = sorted(
+            (normalize_predicate(node["left"]), normalize_predicate(node["right"])),
+            key=lambda operand: (operand.get("type") == "in_subquery", _predicate_key(operand))
+        )
+        return {"type": node_type, "left": operands[0], "right": operands[1]}
+    
+    return node
+
+def _predicate_source(node, names):
+    """
+    Translate a condition into a Python expression over a record named "row".
+    
+    Args:
+        node (dict): The condition to translate
+        names (list): Temporary variable names used so far, extended in place
+        
+    Returns:
+        str: The expression, or None if the condition cannot be compiled
+    """
+    node_type = node.get("type")
+    
+    if node_type == "comparison":
+        operator = PYTHON_OPERATORS.get(node["operator"])
+        if operator is None:
+            return None
+        
+        checks = []
+        operands = []
+        for operand in (node["left"], node["right"]):
+            if operand.get("type") == "column":
+                # Bind the value once so it can be NULL-checked and compared
+                name = f"_v{len(names)}"
+                names.append(name)
+                checks.append(f"({name} := row.get({operand['name']!r})) is not None")
+                operands.append(name)
+            elif operand.get("type") in ("integer", "string") and operand.get("value") is not None:
+                operands.append(repr(operand["value"]))
+            else:
+                return None
+        
+        # Comparisons involving NULL are false, as in the executor
+        return "(" + " and ".join(checks + [f"{operands[0]} {operator} {operands[1]}"]) + ")"
+    
+    if node_type in ("and", "or"):
+        left = _predicate_source(node["left"], names)
+        right = _predicate_source(node["right"], names)
+        if left is None or right is None:
+            return None
+        return f"({left} {node_type} {right})"
+    
+    return None
+
+@lru_cache(maxsize=256)
+def _compile_source(source):
+    """Compile a predicate expression into a function of one record."""
+    return eval(compile(f"lambda row: {source}", "<predicate>", "eval"), {})
+
+def compile_predicate(condition):
+    """
+    Compile a WHERE condition into a function that tests one record.
+    
+    The function gives the same answer as evaluating the condition tree on
+    a record read straight from storage (plain column names as keys), but
+    as a single Python expression. Conditions with parts that need the
+    executor, such as subqueries, are not compiled. Compiled functions are
+    cached by their source, so repeated queries reuse them.
+    
+    Args:
+        condition (dict): The condition to compile
+        
+    Returns:
+        callable: Function taking a record dict and returning a bool, or
+            None if the condition cannot be compiled
+    """
+    source = _predicate_source(condition, [])
+    if source is None:
+        return None
+    return _compile_source(source)
+
+def join_columns(join):
+    """
+    Work out which join condition column belongs to which side of a join.
+    
+    The condition may name the joined (inner) table on either side of the
+    '=', e.g. "FROM e JOIN s ON s.id = e.sid". The optimizer and executor
+    both use this so they agree on the inner table's join column.
+    
+    Args:
+        join (dict): A join from the parsed query (table, optional alias
+            and condition)
+        
+    Returns:
+        tuple: (outer column, inner column)
+    """
+    condition = join["condition"]
+    inner_names = {join["table"], join.get("alias", join["table"])}
+    
+    if condition.get("left_table") in inner_names and condition.get("right_table") not in inner_names:
+        return condition["right_column"], condition["left_column"]
+    return condition["left_column"], condition["right_column"]
+
 class QueryOptimizer:
     """
     Query Optimizer class that optimizes query execution plans.
@@ -40,9 +213,10 @@ class QueryOptimizer:
         if parsed_query["type"] != "SELECT":
             return optimized_query
         
-        # Optimize WHERE conditions
+        # Optimize WHERE conditions, starting from their canonical form
         if "where" in optimized_query and optimized_query["where"]:
-            optimized_query["where"] = self._optimize_conditions(optimized_query["where"], optimized_query["table"])
+            where = normalize_predicate(optimized_query["where"])
+            optimized_query["where"] = self._optimize_conditions(where, optimized_query["table"])
         
         # Optimize JOIN method selection
         if "join" in optimized_query and optimized_query["join"]:
@@ -56,20 +230,21 @@ class QueryOptimizer:
                 # Handle multiple joins
                 for i, join in enumerate(optimized_query["join"]):
                     left_table = optimized_query["table"] if i == 0 else optimized_query["join"][i-1]["table"]
-                    right_table = join["table"]
-                    join_condition = join["condition"]
-                    optimized_query["join"][i]["method"] = self._select_join_method(
-                        left_table,
-                        right_table,
-                        join_condition
-                    )
+                    optimized_query["join"][i]["method"] = self._select_join_method(left_table, join)
             else:
                 # Handle single join
                 optimized_query["join"]["method"] = self._select_join_method(
                     optimized_query["table"],
-                    optimized_query["join"]["table"],
-                    optimized_query["join"]["condition"]
+                    optimized_query["join"]
                 )
+            
+            # Filter single-table conditions while scanning, before joining
+            self._push_down_predicates(optimized_query)
+        
+        # Let a plain table scan stop as soon as LIMIT/OFFSET is satisfied
+        scan_limit = self._get_scan_limit(optimized_query)
+        if scan_limit is not None:
+            optimized_query["scan_limit"] = scan_limit
         
         # Add execution plan info
         optimized_query["execution_plan"] = self._generate_execution_plan(optimized_query)
@@ -133,52 +308,175 @@ class QueryOptimizer:
         
         return condition
     
-    def _select_join_method(self, left_table, right_table, join_condition):
+    def _get_scan_limit(self, query):
+        """
+        Work out how many matching records a scan needs to produce for LIMIT.
+        
+        Only queries whose output rows map one-to-one, in storage order, onto
+        the scanned records qualify: no joins, grouping, aggregates or ORDER BY.
+        
+        Args:
+            query (dict): The optimized query
+            
+        Returns:
+            int: OFFSET plus LIMIT, or None if the whole table must be read
+        """
+        limit = query.get("limit")
+        offset = query.get("offset", 0)
+        
+        # Handle {limit: X, offset: Y} format from parser
+        if isinstance(limit, dict):
+            offset = limit.get("offset", 0)
+            limit = limit.get("limit")
+        
+        if not limit:
+            return None
+        
+        if query.get("join") or query.get("group_by") or query.get("order_by") or query.get("having"):
+            return None
+        
+        projection = query["projection"]
+        if projection["type"] == "columns" and any(
+            col.get("type") == "aggregation" for col in projection["columns"]
+        ):
+            return None
+        
+        return int(offset or 0) + limit
+    
+    def _push_down_predicates(self, query):
+        """
+        Move WHERE conjuncts that only reference one table of a join onto
+        that table's scan.
+        
+        Pushed conditions are stored with unqualified column names, as
+        "table_filter" on the query for the FROM table and as "filter" on
+        the join entry for joined tables. Whatever cannot be pushed stays
+        in "where" and is applied after the joins.
+        
+        Args:
+            query (dict): The optimized query, with a flattened join list
+        """
+        # Work on copies so filters never leak into the caller's parsed query
+        query["join"] = [dict(join) for join in query["join"]]
+        
+        # Map each table name/alias to the dict and key its filter goes in
+        targets = {}
+        
+        def add_target(names, owner, key):
+            for name in names:
+                # A table referenced twice is ambiguous, so never push to it
+                targets[name] = None if name in targets else (owner, key)
+        
+        table = query["table"]
+        if isinstance(table, dict):
+            add_target({table["name"], table["alias"]}, query, "table_filter")
+        else:
+            add_target({table}, query, "table_filter")
+        
+        for join in query["join"]:
+            add_target({join["table"], join.get("alias") or join["table"]}, join, "filter")
+        
+        remaining = []
+        for conjunct in self._split_conjuncts(query["where"]):
+            tables = self._referenced_tables(conjunct)
+            target = targets.get(next(iter(tables))) if tables and len(tables) == 1 else None
+            
+            if target is None:
+                remaining.append(conjunct)
+                continue
+            
+            owner, key = target
+            pushed = self._unqualify_columns(conjunct)
+            owner[key] = pushed if not owner.get(key) else {"type": "and", "left": owner[key], "right": pushed}
+        
+        # Rebuild whatever has to wait until after the joins
+        where = None
+        for conjunct in remaining:
+            where = conjunct if where is None else {"type": "and", "left": where, "right": conjunct}
+        query["where"] = where
+    
+    def _split_conjuncts(self, condition):
+        """Return the operands of a tree of ANDs as a flat list."""
+        if not condition:
+            return []
+        if condition["type"] == "and":
+            return self._split_conjuncts(condition["left"]) + self._split_conjuncts(condition["right"])
+        return [condition]
+    
+    def _referenced_tables(self, condition):
+        """
+        Get the table qualifiers used by the columns in a condition.
+        
+        Returns:
+            set: Qualifiers, or None if some column is unqualified (or the
+                condition type is unknown) and so cannot be attributed
+        """
+        if condition["type"] == "comparison":
+            operands = [condition["left"], condition["right"]]
+        elif condition["type"] in ("and", "or"):
+            left = self._referenced_tables(condition["left"])
+            right = self._referenced_tables(condition["right"])
+            return None if left is None or right is None else left | right
+        else:
+            return None
+        
+        tables = set()
+        for operand in operands:
+            if operand.get("type") != "column":
+                continue
+            if "." not in operand["name"]:
+                return None
+            tables.add(operand["name"].split(".", 1)[0])
+        return tables
+    
+    def _unqualify_columns(self, condition):
+        """Copy a condition with "table.column" references reduced to "column"."""
+        if condition["type"] in ("and", "or"):
+            return {
+                "type": condition["type"],
+                "left": self._unqualify_columns(condition["left"]),
+                "right": self._unqualify_columns(condition["right"])
+            }
+        
+        unqualified = dict(condition)
+        for side in ("left", "right"):
+            operand = condition[side]
+            if operand.get("type") == "column":
+                unqualified[side] = {"type": "column", "name": operand["name"].split(".", 1)[1]}
+        return unqualified
+    
+    def _select_join_method(self, left_table, join):
         """
         Select the optimal join method based on table statistics.
         
         Args:
             left_table (str): Left table name
-            right_table (str): Right table name
-            join_condition (dict): Join condition
+            join (dict): The join, with the right table and its condition
             
         Returns:
-            str: "nested-loop" or "sort-merge"
+            str: "hash", "sort-merge" or "index-nested-loop"
         """
-        left_key = join_condition["left_column"]
-        right_key = join_condition["right_column"]
+        right_table = join["table"]
+        left_key, right_key = join_columns(join)
         
         # Check if join columns are indexed
-        left_indexed = self.schema_manager.index_exists(left_table, left_key)
         right_indexed = self.schema_manager.index_exists(right_table, right_key)
         
         # Check if join columns are sorted (e.g., primary key)
         left_is_pk = self.schema_manager.get_primary_key(left_table) == left_key
         right_is_pk = self.schema_manager.get_primary_key(right_table) == right_key
         
-        # Get table sizes
-        left_size = self.schema_manager.get_record_count(left_table)
-        right_size = self.schema_manager.get_record_count(right_table)
-        
-        # If one table is very small, nested loop may be better
-        size_ratio = max(left_size, right_size) / max(1, min(left_size, right_size))
-        
         # Decision logic
-        if left_indexed and right_indexed:
-            # Both tables have indexes on join columns
+        if right_indexed:
+            # Each outer record probes the inner table's index directly
             return "index-nested-loop"
         elif left_is_pk and right_is_pk:
             # Both join columns are primary keys (sorted)
             return "sort-merge"
-        elif (left_is_pk or right_is_pk) and size_ratio > 10:
-            # One side is a PK and tables have very different sizes
-            return "nested-loop"
-        elif left_size + right_size < 1000:
-            # Small tables, use simple nested loop
-            return "nested-loop"
         else:
-            # Default to sort-merge for larger tables
-            return "sort-merge"
+            # Join conditions are always equalities, and every table is read
+            # into memory whole, so a hash join is linear at any size
+            return "hash"
     
     def _estimate_selectivity(self, table_name, condition):
         """
@@ -279,7 +577,10 @@ class QueryOptimizer:
                     join_method = join_info.get("method", "nested-loop")
                     join_records = self.schema_manager.get_record_count(join_table)
                     
-                    if join_method == "nested-loop":
+                    if join_method == "hash":
+                        # Hash join reads each side once
+                        join_cost = current_records + join_records
+                    elif join_method == "nested-loop":
                         # Nested loop cost is outer * inner
                         join_cost = current_records * join_records
                     elif join_method == "sort-merge":
@@ -313,7 +614,10 @@ class QueryOptimizer:
                 join_method = query["join"].get("method", "nested-loop")
                 join_records = self.schema_manager.get_record_count(join_table)
                 
-                if join_method == "nested-loop":
+                if join_method == "hash":
+                    # Hash join reads each side once
+                    join_cost = plan.get("filter", {}).get("output_records", record_count) + join_records
+                elif join_method == "nested-loop":
                     # Nested loop cost is outer * inner
                     join_cost = plan.get("filter", {}).get("output_records", record_count) * join_records
                 elif join_method == "sort-merge":
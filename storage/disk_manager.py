@@ -14,20 +14,33 @@ class DiskManager:
     Disk Manager class that handles storage operations.
     """
     
-    def __init__(self, db_directory):
+    def __init__(self, db_directory, backend="file"):
         """
         Initialize the Disk Manager.
         
         Args:
             db_directory (str): Directory to store database files
+            backend (str): "file" to persist to db_directory, or "memory" to
+                keep all files in a dictionary (nothing touches the disk)
         """
+        if backend not in ("file", "memory"):
+            raise StorageError(f"Unknown storage backend: {backend}")
+        
         self.db_directory = db_directory
         self.data_directory = os.path.join(db_directory, "data")
         self.index_directory = os.path.join(db_directory, "indexes")
+        self.backend = backend
+        
+        # File contents for the memory backend (path -> bytes)
+        self._files = {}
+        
+        # Stack of file snapshots taken by begin_savepoint()
+        self._savepoints = []
         
         # Create directories if they don't exist
-        os.makedirs(self.data_directory, exist_ok=True)
-        os.makedirs(self.index_directory, exist_ok=True)
+        if self.backend == "file":
+            os.makedirs(self.data_directory, exist_ok=True)
+            os.makedirs(self.index_directory, exist_ok=True)
     
     def get_table_path(self, table_name):
         """Get the file path for a table."""
@@ -37,6 +50,143 @@ class DiskManager:
         """Get the file path for an index."""
         return os.path.join(self.index_directory, f"{table_name}_{column_name}.idx")
     
+    def get_schema_path(self):
+        """Get the file path for the schema catalog."""
+        return os.path.join(self.db_directory, "schema.json")
+    
+    # Backend primitives
+    def _read_file(self, path):
+        """
+        Read the raw contents of a file from the active backend.
+        
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        if self.backend == "memory":
+            try:
+                return self._files[path]
+            except KeyError:
+                raise FileNotFoundError(path) from None
+        with open(path, 'rb') as f:
+            return f.read()
+    
+    def _write_file(self, path, data):
+        """Write raw contents to a file in the active backend."""
+        if self.backend == "memory":
+            self._files[path] = data
+            return
+        with open(path, 'wb') as f:
+            f.write(data)
+    
+    def _remove_file(self, path):
+        """Remove a file from the active backend if it exists."""
+        if self.backend == "memory":
+            self._files.pop(path, None)
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    
+    def _snapshot_files(self):
+        """
+        Capture the contents of every database file.
+        
+        Returns:
+            dict: Mapping of file path -> bytes
+        """
+        if self.backend == "memory":
+            # Values are immutable bytes, so a shallow copy is enough
+            return dict(self._files)
+        
+        snapshot = {}
+        paths = [self.get_schema_path()]
+        for directory in (self.data_directory, self.index_directory):
+            paths.extend(os.path.join(directory, name) for name in os.listdir(directory))
+        
+        for path in paths:
+            try:
+                snapshot[path] = self._read_file(path)
+            except FileNotFoundError:
+                pass
+        
+        return snapshot
+    
+    def begin_savepoint(self):
+        """
+        Remember the current contents of all table, index and schema files.
+        
+        Savepoints nest; each one is closed by rollback_savepoint() or
+        release_savepoint().
+        """
+        try:
+            self._savepoints.append(self._snapshot_files())
+        except Exception as e:
+            raise StorageError(f"Error creating savepoint: {str(e)}")
+    
+    def rollback_savepoint(self):
+        """
+        Restore all files to the state of the most recent savepoint.
+        
+        Files created after the savepoint are removed. Callers holding
+        in-memory copies of the schema must reload it afterwards.
+        """
+        if not self._savepoints:
+            raise StorageError("No savepoint to roll back to")
+        
+        snapshot = self._savepoints.pop()
+        
+        try:
+            for path in set(self._snapshot_files()) - set(snapshot):
+                self._remove_file(path)
+            
+            for path, data in snapshot.items():
+                self._write_file(path, data)
+        except Exception as e:
+            raise StorageError(f"Error rolling back savepoint: {str(e)}")
+    
+    def release_savepoint(self):
+        """Discard the most recent savepoint, keeping all changes since."""
+        if not self._savepoints:
+            raise StorageError("No savepoint to release")
+        
+        self._savepoints.pop()
+    
+    def read_schema(self):
+        """
+        Read the schema catalog.
+        
+        Returns:
+            dict: Schema data, or None if no catalog has been saved yet
+        """
+        try:
+            try:
+                data = self._read_file(self.get_schema_path())
+            except FileNotFoundError:
+                return None
+            
+            return json.loads(data.decode("utf-8"))
+        except Exception as e:
+            raise StorageError(f"Error reading schema: {str(e)}")
+    
+    def write_schema(self, schema_data):
+        """
+        Write the schema catalog.
+        
+        Args:
+            schema_data (dict): JSON-serializable schema data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            data = json.dumps(schema_data, indent=2).encode("utf-8")
+            self._write_file(self.get_schema_path(), data)
+            
+            return True
+        except Exception as e:
+            raise StorageError(f"Error writing schema: {str(e)}")
+    
     def create_table_file(self, table_name):
         """
         Create a new table file.
@@ -51,8 +201,7 @@ class DiskManager:
             table_path = self.get_table_path(table_name)
             
             # Initialize with an empty list of records
-            with open(table_path, 'wb') as f:
-                pickle.dump([], f)
+            self._write_file(table_path, pickle.dumps([]))
             
             return True
         except Exception as e:
@@ -71,8 +220,7 @@ class DiskManager:
         try:
             table_path = self.get_table_path(table_name)
             
-            if os.path.exists(table_path):
-                os.remove(table_path)
+            self._remove_file(table_path)
             
             return True
         except Exception as e:
@@ -93,8 +241,7 @@ class DiskManager:
             index_path = self.get_index_path(table_name, column_name)
             
             # Initialize with an empty dictionary (key -> record_id)
-            with open(index_path, 'wb') as f:
-                pickle.dump({}, f)
+            self._write_file(index_path, pickle.dumps({}))
             
             return True
         except Exception as e:
@@ -114,8 +261,7 @@ class DiskManager:
         try:
             index_path = self.get_index_path(table_name, column_name)
             
-            if os.path.exists(index_path):
-                os.remove(index_path)
+            self._remove_file(index_path)
             
             return True
         except Exception as e:
@@ -134,11 +280,12 @@ class DiskManager:
         try:
             table_path = self.get_table_path(table_name)
             
-            if not os.path.exists(table_path):
+            try:
+                data = self._read_file(table_path)
+            except FileNotFoundError:
                 raise StorageError(f"Table file for '{table_name}' does not exist")
             
-            with open(table_path, 'rb') as f:
-                records = pickle.load(f)
+            records = pickle.loads(data)
             
             return records
         except Exception as e:
@@ -158,13 +305,31 @@ class DiskManager:
         try:
             table_path = self.get_table_path(table_name)
             
-            with open(table_path, 'wb') as f:
-                pickle.dump(records, f)
+            self._share_strings(records)
+            self._write_file(table_path, pickle.dumps(records))
             
             return True
         except Exception as e:
             raise StorageError(f"Error writing table: {str(e)}")
     
+    def _share_strings(self, records):
+        """
+        Make equal string values in a table the same object.
+        
+        Pickle writes an object it has already seen as a back-reference, so
+        each distinct string is stored once per table file, like a
+        dictionary encoding. Records read back share those strings, and
+        comparing equal values takes the identity fast path.
+        
+        Args:
+            records (list): List of records, updated in place
+        """
+        shared = {}
+        for record in records:
+            for key, value in record.items():
+                if type(value) is str:
+                    record[key] = shared.setdefault(value, value)
+    
     def read_index(self, table_name, column_name):
         """
         Read an index.
@@ -179,11 +344,12 @@ class DiskManager:
         try:
             index_path = self.get_index_path(table_name, column_name)
             
-            if not os.path.exists(index_path):
+            try:
+                data = self._read_file(index_path)
+            except FileNotFoundError:
                 raise StorageError(f"Index file for '{table_name}.{column_name}' does not exist")
             
-            with open(index_path, 'rb') as f:
-                index = pickle.load(f)
+            index = pickle.loads(data)
             
             return index
         except Exception as e:
@@ -204,8 +370,7 @@ class DiskManager:
         try:
             index_path = self.get_index_path(table_name, column_name)
             
-            with open(index_path, 'wb') as f:
-                pickle.dump(index, f)
+            self._write_file(index_path, pickle.dumps(index))
             
             return True
         except Exception as e:
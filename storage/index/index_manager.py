@@ -244,6 +244,22 @@ class IndexManager:
         except Exception as e:
             raise IndexError(f"Error looking up range in index: {str(e)}")
     
+    def get_index(self, table_name, column_name):
+        """
+        Get a whole index, for callers that probe it many times.
+        
+        Args:
+            table_name (str): Name of the table
+            column_name (str): Name of the indexed column
+            
+        Returns:
+            dict: Index mapping (key -> record ID or list of record IDs)
+        """
+        try:
+            return self.disk_manager.read_index(table_name, column_name)
+        except Exception as e:
+            raise IndexError(f"Error reading index: {str(e)}")
+    
     def get_all_keys(self, table_name, column_name):
         """
         Get all keys in an index.
@@ -0,0 +1,75 @@
+"""
+Shared pytest configuration for the DBMS tests.
+"""
+
+import sys
+import pathlib
+from collections import namedtuple
+
+import pytest
+
+# Make the project packages importable once for the whole test session
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from parser.sql_parser import SQLParser
+from catalog.schema_manager import SchemaManager
+from storage.disk_manager import DiskManager
+from storage.index.index_manager import IndexManager
+from query.optimizer import QueryOptimizer
+from execution.executor import Executor
+
+# Components of one DBMS stack, as handed to tests by the dbms fixture
+DBMS = namedtuple(
+    "DBMS",
+    ["parser", "schema_manager", "disk_manager", "index_manager", "optimizer", "executor"]
+)
+
+@pytest.fixture(scope="session")
+def dbms(tmp_path_factory):
+    """
+    Build one in-memory DBMS stack for the whole test session.
+    
+    Tests that use it directly are responsible for undoing their changes;
+    most should use isolated_dbms instead.
+    
+    Returns:
+        DBMS: The shared components
+    """
+    disk_manager = DiskManager(str(tmp_path_factory.mktemp("dbms")), backend="memory")
+    schema_manager = SchemaManager(disk_manager)
+    index_manager = IndexManager(disk_manager)
+    optimizer = QueryOptimizer(schema_manager, index_manager)
+    executor = Executor(schema_manager, disk_manager, index_manager, optimizer)
+    
+    return DBMS(SQLParser(), schema_manager, disk_manager, index_manager, optimizer, executor)
+
+@pytest.fixture
+def isolated_dbms(dbms):
+    """
+    Hand a test the shared DBMS stack and roll back its changes afterwards.
+    
+    Returns:
+        DBMS: The shared components, restored to their prior state after
+            the test
+    """
+    dbms.disk_manager.begin_savepoint()
+    yield dbms
+    dbms.disk_manager.rollback_savepoint()
+    
+    # Bring the in-memory catalog back in line with the restored files
+    dbms.schema_manager.load_schema()
+
+@pytest.fixture(scope="class")
+def bind_dbms(request, dbms):
+    """
+    Expose the shared DBMS components as attributes of the test class.
+    
+    Classes combine this with isolated_dbms, which hands out the same
+    components, to reach them as self.parser, self.executor and so on.
+    
+    Returns:
+        DBMS: The shared components
+    """
+    for name, component in dbms._asdict().items():
+        setattr(request.cls, name, component)
+    return dbms
@@ -2,122 +2,105 @@
 Enhanced tests for the DBMS implementation.
 """
 
-import os
-import shutil
-import pytest
+import copy
+import io
+import re
 import sys
 
+import pytest
+
 from parser.sql_parser import SQLParser
-from catalog.schema_manager import SchemaManager
-from storage.disk_manager import DiskManager
-from storage.index.index_manager import IndexManager
-from query.optimizer import QueryOptimizer
-from execution.executor import Executor
+from query.optimizer import normalize_predicate, compile_predicate
 from common.exceptions import DBMSError
 
-# Test database directory
-TEST_DB_DIR = "./test_database"
+# Keep this module on one xdist worker; its tests share one DBMS stack
+pytestmark = pytest.mark.xdist_group(name="basic")
+
+# Shared parser; parse() resets its own state between queries
+_PARSER = SQLParser()
+
+# Statements shared by several tests; interned so parse-cache lookups hit by identity
+Q_CREATE_STUDENTS = sys.intern("CREATE TABLE students (id INTEGER PRIMARY KEY, name STRING, age INTEGER)")
+Q_CREATE_COURSES = sys.intern("CREATE TABLE courses (id INTEGER PRIMARY KEY, name STRING)")
+Q_INSERT_JOHN = sys.intern("INSERT INTO students VALUES (1, 'John Doe', 20)")
+Q_INSERT_JANE = sys.intern("INSERT INTO students VALUES (2, 'Jane Smith', 22)")
+Q_SELECT_STUDENTS = sys.intern("SELECT * FROM students")
+Q_CREATE_NAME_INDEX = sys.intern("CREATE INDEX ON students (name)")
+Q_DESCRIBE_STUDENTS = sys.intern("DESCRIBE students")
+
+# Parsed form of every SQL string the executor tests have run (query -> dict)
+_PARSE_CACHE = {}
+
+# Query types whose parsed dict is never modified during execution
+_READ_ONLY_QUERY_TYPES = {"SHOW_TABLES", "DESCRIBE", "DROP_TABLE", "CREATE_INDEX", "DROP_INDEX"}
+
+# Student names used by the sample data, for checking row order in one scan
+_STUDENT_NAMES = re.compile(r"Jane Smith|John Doe|Alice Johnson")
+
+# Everything the executor tests look for in a result, matched in one pass
+_ASSERT_TOKENS = re.compile(
+    r"John Doe|Jane Smith|Database Systems|Data Structures|students|courses"
+    r"|INTEGER|STRING|Primary Key|\bid\b|\bname\b|\bage\b"
+)
+
+def _found_tokens(result):
+    """Return the set of _ASSERT_TOKENS that occur in a result string."""
+    return set(_ASSERT_TOKENS.findall(result))
+
+JOIN_QUERY = """
+        SELECT students.name, courses.title
+        FROM students
+        JOIN enrollments ON students.id = enrollments.student_id
+        JOIN courses ON courses.course_id = enrollments.course_id
+        """
+
+JOIN_WITH_WHERE_QUERY = """
+        SELECT students.name, courses.title
+        FROM students
+        JOIN enrollments ON students.id = enrollments.student_id
+        JOIN courses ON courses.course_id = enrollments.course_id
+        WHERE courses.credits > 3
+        """
 
-class TestDBMS:
-    """Test the DBMS implementation."""
+class TestDBMSParser:
+    """Test the parser output of the DBMS implementation.
     
-    @classmethod
-    def setup_class(cls):
-        """Set up the test environment."""
-        # Create test database directory
-        os.makedirs(TEST_DB_DIR, exist_ok=True)
-        
-        # Initialize components
-        cls.disk_manager = DiskManager(TEST_DB_DIR)
-        cls.schema_manager = SchemaManager(cls.disk_manager)
-        cls.index_manager = IndexManager(cls.disk_manager)
-        cls.parser = SQLParser()
-        cls.optimizer = QueryOptimizer(cls.schema_manager, cls.index_manager)
-        cls.executor = Executor(
-            cls.schema_manager, 
-            cls.disk_manager,
-            cls.index_manager,
-            cls.optimizer
-        )
+    These tests never touch storage, so they skip the database setup
+    done by TestDBMSExecutor.
+    """
     
-    @classmethod
-    def teardown_class(cls):
-        """Clean up the test environment."""
-        # Remove test database directory
-        shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
-    
-    def setup_method(self):
-        """Set up before each test method."""
-        # Drop any existing tables
-        try:
-            for table in self.schema_manager.get_tables():
-                query = f"DROP TABLE {table}"
-                parsed_query = self.parser.parse(query)
-                self.executor.execute(parsed_query)
-        except:
-            # Ignore errors during setup
-            pass
+    parser = _PARSER
     
-    def test_create_table(self):
-        """Test CREATE TABLE statement."""
-        query = "CREATE TABLE students (id INTEGER PRIMARY KEY, name STRING, age INTEGER)"
+    def test_parse_create_table(self):
+        """Test parsing a CREATE TABLE statement."""
+        query = Q_CREATE_STUDENTS
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "CREATE_TABLE"
         assert parsed_query["table_name"] == "students"
         assert len(parsed_query["columns"]) == 3
         assert parsed_query["primary_key"] == "id"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "created successfully" in result
     
-    def test_insert(self):
-        """Test INSERT statement."""
-        # First create a table
-        self._create_students_table()
-        
-        query = "INSERT INTO students VALUES (1, 'John Doe', 20)"
+    def test_parse_insert(self):
+        """Test parsing an INSERT statement."""
+        query = Q_INSERT_JOHN
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "INSERT"
         assert parsed_query["table_name"] == "students"
         assert len(parsed_query["values"]) == 3
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "record inserted" in result
-        
-        # Insert another record
-        query = "INSERT INTO students VALUES (2, 'Jane Smith', 22)"
-        parsed_query = self.parser.parse(query)
-        result = self.executor.execute(parsed_query)
-        assert "record inserted" in result
     
-    def test_select(self):
-        """Test basic SELECT statement."""
-        # Set up test data
-        self._create_students_table()
-        self._insert_sample_students()
-        
-        query = "SELECT * FROM students"
+    def test_parse_select(self):
+        """Test parsing a basic SELECT statement."""
+        query = Q_SELECT_STUDENTS
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "SELECT"
         assert parsed_query["table"] == "students"
         assert parsed_query["projection"]["type"] == "all"
- 
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "John Doe" in result
-        assert "Jane Smith" in result
     
-    def test_select_with_where(self):
-        """Test SELECT with WHERE clause."""
-        # Set up test data
-        self._create_students_table()
-        self._insert_sample_students()
-        
+    def test_parse_select_with_where(self):
+        """Test parsing a SELECT with WHERE clause."""
         query = "SELECT name, age FROM students WHERE age > 21"
         parsed_query = self.parser.parse(query)
         
@@ -125,305 +108,321 @@ class TestDBMS:
         assert parsed_query["table"] == "students"
         assert parsed_query["where"]["type"] == "comparison"
         assert parsed_query["where"]["operator"] == ">"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "Jane Smith" in result
-        assert "John Doe" not in result
     
-    def test_select_with_order_by(self):
-        """Test SELECT with ORDER BY clause."""
-        # Set up test data
-        self._create_students_table()
-        self._insert_sample_students()
-        
-        # Add more students
-        query = "INSERT INTO students VALUES (3, 'Alice Johnson', 19)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
+    def test_parse_select_with_order_by(self):
+        """Test parsing a SELECT with ORDER BY clause."""
         query = "SELECT * FROM students ORDER BY age DESC"
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "SELECT"
         assert parsed_query["order_by"] is not None
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        
-        # The result should list Jane first (age 22), then John (age 20), then Alice (age 19)
-        # Check if the order is correct by finding positions in the result string
-        assert result.find("Jane Smith") < result.find("John Doe")
-        assert result.find("John Doe") < result.find("Alice Johnson")
     
-    def test_update(self):
-        """Test UPDATE statement."""
-        # Set up test data
-        self._create_students_table()
-        self._insert_sample_students()
-        
+    def test_parse_update(self):
+        """Test parsing an UPDATE statement."""
         query = "UPDATE students SET age = 21 WHERE id = 1"
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "UPDATE"
         assert parsed_query["table_name"] == "students"
         assert len(parsed_query["set_items"]) == 1
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        # Use a more flexible assertion that matches the actual format
-        assert "record(s) updated in 'students'" in result
-        
-        # Verify the update
-        query = "SELECT * FROM students WHERE id = 1"
-        parsed_query = self.parser.parse(query)
-        result = self.executor.execute(parsed_query)
-        assert "21" in result
     
-    def test_delete(self):
-        """Test DELETE statement."""
-        # Set up test data
-        self._create_students_table()
-        self._insert_sample_students()
-        
+    def test_parse_delete(self):
+        """Test parsing a DELETE statement."""
         query = "DELETE FROM students WHERE id = 2"
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "DELETE"
         assert parsed_query["table_name"] == "students"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        # Use a more flexible assertion for the message format
-        assert "record(s) deleted from 'students'" in result
-        
-        # Verify the delete
-        query = "SELECT * FROM students"
-        parsed_query = self.parser.parse(query)
-        result = self.executor.execute(parsed_query)
-        assert "Jane Smith" not in result
-        assert "John Doe" in result
     
-    def test_create_index(self):
-        """Test CREATE INDEX statement."""
-        # Set up test data
-        self._create_students_table()
-        
-        query = "CREATE INDEX ON students (name)"
+    def test_parse_create_index(self):
+        """Test parsing a CREATE INDEX statement."""
+        query = Q_CREATE_NAME_INDEX
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "CREATE_INDEX"
         assert parsed_query["table_name"] == "students"
         assert parsed_query["column_name"] == "name"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "Index created" in result
-        
-        # Verify the index exists
-        assert self.schema_manager.index_exists("students", "name")
     
-    def test_drop_index(self):
-        """Test DROP INDEX statement."""
-        # Set up test data
-        self._create_students_table()
-        
-        # Create index
-        query = "CREATE INDEX ON students (name)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Now drop the index
+    def test_parse_drop_index(self):
+        """Test parsing a DROP INDEX statement."""
         query = "DROP INDEX ON students (name)"
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "DROP_INDEX"
         assert parsed_query["table_name"] == "students"
         assert parsed_query["column_name"] == "name"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "Index dropped" in result
-        
-        # Verify the index no longer exists
-        assert not self.schema_manager.index_exists("students", "name")
     
-    def test_drop_table(self):
-        """Test DROP TABLE statement."""
-        # First create a table
-        query = "CREATE TABLE courses (id INTEGER PRIMARY KEY, name STRING)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Now drop it
+    def test_parse_drop_table(self):
+        """Test parsing a DROP TABLE statement."""
         query = "DROP TABLE courses"
         parsed_query = self.parser.parse(query)
         
         assert parsed_query["type"] == "DROP_TABLE"
         assert parsed_query["table_name"] == "courses"
+    
+    def test_parse_join(self):
+        """Test parsing a JOIN query."""
+        parsed_query = self.parser.parse(JOIN_QUERY)
         
-        # Execute the query
-        result = self.executor.execute(parsed_query)
-        assert "dropped successfully" in result
+        assert parsed_query["type"] == "SELECT"
+        assert "join" in parsed_query
+    
+    def test_parse_join_with_where(self):
+        """Test parsing a JOIN query with WHERE clause."""
+        parsed_query = self.parser.parse(JOIN_WITH_WHERE_QUERY)
         
-        # Verify the table no longer exists
-        assert not self.schema_manager.table_exists("courses")
+        assert parsed_query["type"] == "SELECT"
+        assert "join" in parsed_query
+        assert parsed_query["where"] is not None
     
-    def test_join(self):
-        """Test JOIN operation."""
-        # Set up test data - create students and courses tables
-        self._create_students_table()
-        self._insert_sample_students()
-        
-        # Create courses table
-        query = """
-        CREATE TABLE courses (
-            course_id INTEGER PRIMARY KEY,
-            title STRING,
-            credits INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+    def test_parse_show_tables(self):
+        """Test parsing a SHOW TABLES statement."""
+        parsed_query = self.parser.parse("SHOW TABLES")
         
-        # Insert sample courses
-        query = "INSERT INTO courses VALUES (101, 'Database Systems', 3)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        assert parsed_query["type"] == "SHOW_TABLES"
+    
+    def test_parse_describe(self):
+        """Test parsing a DESCRIBE statement."""
+        parsed_query = self.parser.parse(Q_DESCRIBE_STUDENTS)
         
-        query = "INSERT INTO courses VALUES (102, 'Data Structures', 4)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Create enrollments table
-        query = """
-        CREATE TABLE enrollments (
-            enrollment_id INTEGER PRIMARY KEY,
-            student_id INTEGER,
-            course_id INTEGER
+        assert parsed_query["type"] == "DESCRIBE"
+        assert parsed_query["table_name"] == "students"
+    
+    def test_identifiers_are_interned(self):
+        """Test that names and operators from separate parses share one object."""
+        first = self.parser.parse("SELECT name FROM students WHERE students.age != 21")
+        second = self.parser.parse("SELECT name FROM students WHERE students.age != 22")
+        
+        assert first["table"] is second["table"]
+        assert first["where"]["left"]["name"] is second["where"]["left"]["name"]
+        assert first["where"]["operator"] is second["where"]["operator"]
+    
+    def test_parse_batch(self):
+        """Test parsing a batch whose string literal contains a semicolon."""
+        parsed_queries = self.parser.parse_batch(
+            "INSERT INTO students VALUES (3, 'Smith; Jr', 30);\n"
+            "SELECT * FROM students WHERE name = 'a;b';;"
         )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
         
-        # Insert sample enrollments
-        query = "INSERT INTO enrollments VALUES (1, 1, 101)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        assert [q["type"] for q in parsed_queries] == ["INSERT", "SELECT"]
+        assert parsed_queries[0]["values"][1]["value"] == "Smith; Jr"
+        assert parsed_queries[1]["where"]["right"]["value"] == "a;b"
+    
+    def test_iter_statements_is_lazy(self):
+        """Test that statements are yielded one at a time, quotes respected."""
+        statements = SQLParser.iter_statements("SELECT 'x;y' FROM t; ; DROP TABLE t")
         
-        query = "INSERT INTO enrollments VALUES (2, 2, 102)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        assert next(statements) == "SELECT 'x;y' FROM t"
+        assert list(statements) == ["DROP TABLE t"]
+    
+    def test_iter_statements_from_stream(self):
+        """Test that a literal split across read chunks stays intact."""
+        stream = io.StringIO("INSERT INTO t VALUES (1, 'a;b;c');\nSELECT * FROM t;")
         
-        # Test JOIN query
-        query = """
-        SELECT students.name, courses.title
-        FROM students
-        JOIN enrollments ON students.id = enrollments.student_id
-        JOIN courses ON courses.course_id = enrollments.course_id
+        statements = list(SQLParser.iter_statements_from_stream(stream, chunk_size=4))
+        
+        assert statements == ["INSERT INTO t VALUES (1, 'a;b;c')", "SELECT * FROM t"]
+
+class TestPredicateNormalization:
+    """Test the canonical WHERE form produced by normalize_predicate."""
+    
+    def test_literal_moves_to_the_right(self):
+        """Test that 'value op column' is rewritten as 'column op value'."""
+        condition = {
+            "type": "comparison",
+            "left": {"type": "integer", "value": 30},
+            "operator": "<",
+            "right": {"type": "column", "name": "age"}
+        }
+        
+        normalized = normalize_predicate(condition)
+        
+        assert normalized["left"] == {"type": "column", "name": "age"}
+        assert normalized["operator"] == ">"
+        assert normalized["right"] == {"type": "integer", "value": 30}
+        assert condition["left"]["type"] == "integer"  # input left untouched
+    
+    def test_operand_order_is_canonical(self):
+        """Test that AND/OR operand order does not change the normalized tree."""
+        first = _PARSER.parse("SELECT * FROM students WHERE age > 20 AND name = 'Alice'")
+        second = _PARSER.parse("SELECT * FROM students WHERE name = 'Alice' AND age > 20")
+        
+        assert normalize_predicate(first["where"]) == normalize_predicate(second["where"])
+
+class TestPredicateCompilation:
+    """Test WHERE conditions compiled by compile_predicate."""
+    
+    def test_compiled_matches_sql_semantics(self):
+        """Test AND/OR, string literals and NULL handling of a compiled condition."""
+        where = _PARSER.parse(
+            "SELECT * FROM users WHERE (age < 25 OR age > 30) AND name != 'Bob'"
+        )["where"]
+        predicate = compile_predicate(where)
+        
+        assert predicate({"age": 20, "name": "Alice"})
+        assert predicate({"age": 35, "name": "Carol"})
+        assert not predicate({"age": 27, "name": "Alice"})
+        assert not predicate({"age": 20, "name": "Bob"})
+        assert not predicate({"age": None, "name": "Alice"})  # NULL never matches
+        assert not predicate({"name": "Alice"})               # missing column is NULL
+    
+    def test_subquery_is_not_compiled(self):
+        """Test that conditions needing the executor are left uncompiled."""
+        condition = {
+            "type": "and",
+            "left": {"type": "comparison", "left": {"type": "column", "name": "age"},
+                     "operator": ">", "right": {"type": "integer", "value": 20}},
+            "right": {"type": "in_subquery", "column": {"type": "column", "name": "id"},
+                      "subquery": {}}
+        }
+        
+        assert compile_predicate(condition) is None
+
+@pytest.mark.usefixtures("bind_dbms", "isolated_dbms")
+class _ExecutorTestBase:
+    """Shared setup and helpers for tests that execute queries.
+    
+    isolated_dbms undoes each test's changes to the shared DBMS stack.
+    """
+    
+    # Helper methods
+    @classmethod
+    def _parse(cls, query):
         """
-        parsed_query = self.parser.parse(query)
+        Parse a query, reusing the result of earlier identical queries.
         
-        assert parsed_query["type"] == "SELECT"
-        assert "join" in parsed_query
+        The optimizer and schema manager keep or modify parts of the parsed
+        dict, so every other query type gets its own copy.
+        """
+        parsed_query = _PARSE_CACHE.get(query)
+        if parsed_query is None:
+            parsed_query = _PARSE_CACHE[query] = cls.parser.parse(query)
         
+        if parsed_query["type"] in _READ_ONLY_QUERY_TYPES:
+            return parsed_query
+        return copy.deepcopy(parsed_query)
+    
+    @classmethod
+    def _run(cls, query):
+        """Parse (through the cache) and execute a query, returning its result."""
+        return cls.executor.execute(cls._parse(query))
+    
+    @classmethod
+    def _create_students_table(cls):
+        """Helper to create students table."""
+        cls._run(Q_CREATE_STUDENTS)
+    
+    @classmethod
+    def _insert_sample_students(cls):
+        """Helper to insert sample student data."""
+        cls.executor.execute_bulk_insert("students", [
+            (1, 'John Doe', 20),
+            (2, 'Jane Smith', 22)
+        ])
+
+class TestDBMSExecutor(_ExecutorTestBase):
+    """Test query execution against the session-wide DBMS stack (see conftest.py)."""
+    
+    def test_create_table(self):
+        """Test CREATE TABLE statement."""
         # Execute the query
-        result = self.executor.execute(parsed_query)
-        
-        # Check for expected results in the join
-        assert "John Doe" in result and "Database Systems" in result
-        assert "Jane Smith" in result and "Data Structures" in result
+        result = self._run(Q_CREATE_STUDENTS)
+        assert "created successfully" in result
     
-    def test_join_with_where(self):
-        """Test JOIN with WHERE clause."""
-        # Set up test data - create students and courses tables
+    def test_insert(self):
+        """Test INSERT statement."""
+        # First create a table
         self._create_students_table()
-        self._insert_sample_students()
-        
-        # Create courses table
-        query = """
-        CREATE TABLE courses (
-            course_id INTEGER PRIMARY KEY,
-            title STRING,
-            credits INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
         
-        # Insert sample courses
-        query = "INSERT INTO courses VALUES (101, 'Database Systems', 3)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        # Execute the query
+        result = self._run(Q_INSERT_JOHN)
+        assert "record inserted" in result
         
-        query = "INSERT INTO courses VALUES (102, 'Data Structures', 4)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Create enrollments table
-        query = """
-        CREATE TABLE enrollments (
-            enrollment_id INTEGER PRIMARY KEY,
-            student_id INTEGER,
-            course_id INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        # Insert another record
+        result = self._run(Q_INSERT_JANE)
+        assert "record inserted" in result
+    
+    def test_bulk_insert(self):
+        """Test inserting several rows at once."""
+        self._create_students_table()
         
-        # Insert sample enrollments
-        query = "INSERT INTO enrollments VALUES (1, 1, 101)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        result = self.executor.execute_bulk_insert("students", [
+            (3, 'Bob Brown', 19),
+            (4, 'Amy Lee', 23)
+        ])
+        assert "2 record(s) inserted" in result
         
-        query = "INSERT INTO enrollments VALUES (2, 2, 102)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        result = self._run("SELECT * FROM students WHERE age > 22")
+        assert "Amy Lee" in result
+        assert "Bob Brown" not in result
         
-        # Test JOIN query with WHERE
-        query = """
-        SELECT students.name, courses.title
-        FROM students
-        JOIN enrollments ON students.id = enrollments.student_id
-        JOIN courses ON courses.course_id = enrollments.course_id
-        WHERE courses.credits > 3
-        """
-        parsed_query = self.parser.parse(query)
+        # Rows must match the table's column count
+        with pytest.raises(DBMSError):
+            self.executor.execute_bulk_insert("students", [(5, 'Short Row')])
+    
+    def test_table_strings_are_stored_once(self):
+        """Test that equal string values share one object after a round trip."""
+        records = [
+            {"__id__": 0, "major": "".join(["Phys", "ics"])},
+            {"__id__": 1, "major": "".join(["Phys", "ics"])}
+        ]
+        self.disk_manager.write_table("majors", records)
         
-        assert parsed_query["type"] == "SELECT"
-        assert "join" in parsed_query
-        assert parsed_query["where"] is not None
+        first, second = self.disk_manager.read_table("majors")
+        assert first["major"] == "Physics"
+        assert first["major"] is second["major"]
+    
+    def test_create_index(self):
+        """Test CREATE INDEX statement."""
+        # Set up test data
+        self._create_students_table()
         
         # Execute the query
-        result = self.executor.execute(parsed_query)
+        result = self._run(Q_CREATE_NAME_INDEX)
+        assert "Index created" in result
         
-        # Check for expected results in the join with WHERE
-        assert "Database Systems" not in result  # Has credits = 3
-        assert "Data Structures" in result       # Has credits = 4
-        assert "Jane Smith" in result            # Enrolled in Data Structures
-        assert "John Doe" not in result          # Enrolled in Database Systems
+        # Verify the index exists
+        assert self.schema_manager.index_exists("students", "name")
+    
+    def test_drop_index(self):
+        """Test DROP INDEX statement."""
+        # Set up test data
+        self._create_students_table()
+        
+        # Create index
+        self._run(Q_CREATE_NAME_INDEX)
+        
+        # Now drop the index
+        result = self._run("DROP INDEX ON students (name)")
+        assert "Index dropped" in result
+        
+        # Verify the index no longer exists
+        assert not self.schema_manager.index_exists("students", "name")
+    
+    def test_drop_table(self):
+        """Test DROP TABLE statement."""
+        # First create a table
+        self._run(Q_CREATE_COURSES)
+        
+        # Now drop it
+        result = self._run("DROP TABLE courses")
+        assert "dropped successfully" in result
+        
+        # Verify the table no longer exists
+        assert not self.schema_manager.table_exists("courses")
     
     def test_show_tables(self):
         """Test SHOW TABLES statement."""
         # Create a few tables
         self._create_students_table()
         
-        query = "CREATE TABLE courses (id INTEGER PRIMARY KEY, name STRING)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+        self._run(Q_CREATE_COURSES)
         
         # Test SHOW TABLES
-        query = "SHOW TABLES"
-        parsed_query = self.parser.parse(query)
-        
-        assert parsed_query["type"] == "SHOW_TABLES"
-        
-        # Execute the query
-        result = self.executor.execute(parsed_query)
+        result = self._run("SHOW TABLES")
         
         # Check that both tables are listed
-        assert "students" in result
-        assert "courses" in result
+        assert {"students", "courses"} <= _found_tokens(result)
     
     def test_describe(self):
         """Test DESCRIBE statement."""
@@ -431,22 +430,27 @@ class TestDBMS:
         self._create_students_table()
         
         # Test DESCRIBE
-        query = "DESCRIBE students"
-        parsed_query = self.parser.parse(query)
+        result = self._run(Q_DESCRIBE_STUDENTS)
         
-        assert parsed_query["type"] == "DESCRIBE"
-        assert parsed_query["table_name"] == "students"
+        # Check that column information is displayed
+        found = _found_tokens(result)
+        assert {"id", "name", "age", "INTEGER", "STRING", "Primary Key"} <= found
+    
+    def test_describe_reflects_schema_changes(self):
+        """Test that DESCRIBE output is refreshed after DDL."""
+        self._create_students_table()
         
-        # Execute the query
-        result = self.executor.execute(parsed_query)
+        query = Q_DESCRIBE_STUDENTS
+        before = self._run(query)
+        assert "age | INTEGER | No | No" in before
         
-        # Check that column information is displayed
-        assert "id" in result
-        assert "name" in result
-        assert "age" in result
-        assert "INTEGER" in result
-        assert "STRING" in result
-        assert "primary key" in result.lower() or "yes" in result.lower()
+        # Repeat calls on an unchanged schema return the same output
+        assert self._run(query) == before
+        
+        self._run("CREATE INDEX ON students (age)")
+        
+        after = self._run(query)
+        assert "age | INTEGER | No | Yes" in after
     
     def test_error_handling(self):
         """Test error handling."""
@@ -455,32 +459,233 @@ class TestDBMS:
         
         # Test case 1: Try to create a table that already exists
         query = "CREATE TABLE students (id INTEGER PRIMARY KEY, name STRING)"
-        parsed_query = self.parser.parse(query)
-        
         with pytest.raises(DBMSError):
-            self.executor.execute(parsed_query)
+            self._run(query)
         
         # Test case 2: Try to select from a non-existent table
         query = "SELECT * FROM non_existent_table"
-        parsed_query = self.parser.parse(query)
-        
         with pytest.raises(DBMSError):
-            self.executor.execute(parsed_query)
+            self._run(query)
+
+class TestDBMSQueries(_ExecutorTestBase):
+    """Test reads and writes against a students table seeded once for the class."""
     
-    # Helper methods
-    def _create_students_table(self):
-        """Helper to create students table."""
-        query = "CREATE TABLE students (id INTEGER PRIMARY KEY, name STRING, age INTEGER)"
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _students_table(cls, bind_dbms):
+        """Create and fill the students table once for the whole class."""
+        cls.disk_manager.begin_savepoint()
+        
+        with cls.schema_manager.batched():
+            cls._create_students_table()
+            cls._insert_sample_students()
+        
+        yield
+        
+        cls.disk_manager.rollback_savepoint()
+        cls.schema_manager.load_schema()
     
-    def _insert_sample_students(self):
-        """Helper to insert sample student data."""
-        queries = [
-            "INSERT INTO students VALUES (1, 'John Doe', 20)",
-            "INSERT INTO students VALUES (2, 'Jane Smith', 22)"
-        ]
+    def test_select(self):
+        """Test basic SELECT statement."""
+        # Execute the query
+        result = self._run(Q_SELECT_STUDENTS)
+        assert "John Doe" in result
+        assert "Jane Smith" in result
+    
+    def test_select_result_rows(self):
+        """Test that SELECT results carry their columns and raw row values."""
+        result = self._run(Q_SELECT_STUDENTS)
+        
+        assert {"id", "name", "age"} <= set(result.columns)
+        assert len(result.rows) == len(result.splitlines()) - 2
+        assert 20 in result.column_values("age")
+        assert {"John Doe", "Jane Smith"} <= result.column_values("name")
+        assert result.column_values("missing") == set()
+    
+    def test_empty_select_result_rows(self):
+        """Test that a SELECT matching nothing still carries (empty) rows."""
+        result = self._run("SELECT * FROM students WHERE id > 5")
+        
+        assert result == "No results found"
+        assert result.rows == []
+        assert result.columns == []
+    
+    def test_limit_stops_scan_early(self):
+        """Test that LIMIT/OFFSET on a plain scan bounds the records read."""
+        query = self._parse("SELECT name FROM students LIMIT 1 OFFSET 1")
+        assert self.optimizer.optimize(query)["scan_limit"] == 2
+        
+        result = self.executor.execute(query)
+        assert len(result.rows) == 1
+        
+        # Sorting needs every record, so ORDER BY keeps the full scan
+        query = self._parse("SELECT name FROM students ORDER BY age LIMIT 1")
+        assert "scan_limit" not in self.optimizer.optimize(query)
+    
+    def test_optimized_query_is_not_reoptimized(self, monkeypatch):
+        """Test that the executor runs an already optimized SELECT as given."""
+        optimized_query = self.optimizer.optimize(self._parse("SELECT name FROM students"))
+        
+        def fail(query):
+            raise AssertionError("optimize() called again")
+        monkeypatch.setattr(self.optimizer, "optimize", fail)
+        
+        result = self.executor.execute(optimized_query)
+        assert ("John Doe",) in result.rows
+    
+    def test_select_with_where(self):
+        """Test SELECT with WHERE clause."""
+        # Execute the query
+        result = self._run("SELECT name, age FROM students WHERE age > 21")
+        assert "Jane Smith" in result
+        assert "John Doe" not in result
+    
+    def test_select_with_order_by(self):
+        """Test SELECT with ORDER BY clause."""
+        # Add more students
+        self._run("INSERT INTO students VALUES (3, 'Alice Johnson', 19)")
+        
+        # Execute the query
+        result = self._run("SELECT * FROM students ORDER BY age DESC")
         
-        for query in queries:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
\ No newline at end of file
+        # The result should list Jane first (age 22), then John (age 20), then Alice (age 19)
+        expected_order = ["Jane Smith", "John Doe", "Alice Johnson"]
+        names = _STUDENT_NAMES.findall(result)
+        assert set(names) == set(expected_order)
+        assert names == sorted(names, key=expected_order.index)
+    
+    def test_update(self):
+        """Test UPDATE statement."""
+        # Execute the query
+        result = self._run("UPDATE students SET age = 21 WHERE id = 1")
+        # Use a more flexible assertion that matches the actual format
+        assert "record(s) updated in 'students'" in result
+        
+        # Verify the update
+        result = self._run("SELECT * FROM students WHERE id = 1")
+        assert "21" in result
+    
+    def test_delete(self):
+        """Test DELETE statement."""
+        # Execute the query
+        result = self._run("DELETE FROM students WHERE id = 2")
+        # Use a more flexible assertion for the message format
+        assert "record(s) deleted from 'students'" in result
+        
+        # Verify the delete
+        result = self._run(Q_SELECT_STUDENTS)
+        assert "Jane Smith" not in result
+        assert "John Doe" in result
+
+class TestDBMSJoins(_ExecutorTestBase):
+    """Test JOIN queries against students, courses and enrollments seeded once."""
+    
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _join_tables(cls, bind_dbms):
+        """Create and fill the three join tables once for the whole class."""
+        cls.disk_manager.begin_savepoint()
+        
+        # Seed all three tables with a single schema write
+        with cls.schema_manager.batched():
+            # Set up test data - create students and courses tables
+            cls._create_students_table()
+            cls._insert_sample_students()
+            
+            # Create courses table
+            cls._run("""
+            CREATE TABLE courses (
+                course_id INTEGER PRIMARY KEY,
+                title STRING,
+                credits INTEGER
+            )
+            """)
+            
+            # Insert sample courses
+            cls.executor.execute_bulk_insert("courses", [
+                (101, 'Database Systems', 3),
+                (102, 'Data Structures', 4)
+            ])
+            
+            # Create enrollments table
+            cls._run("""
+            CREATE TABLE enrollments (
+                enrollment_id INTEGER PRIMARY KEY,
+                student_id INTEGER,
+                course_id INTEGER
+            )
+            """)
+            
+            # Insert sample enrollments
+            cls.executor.execute_bulk_insert("enrollments", [
+                (1, 1, 101),
+                (2, 2, 102)
+            ])
+        
+        yield
+        
+        cls.disk_manager.rollback_savepoint()
+        cls.schema_manager.load_schema()
+    
+    def test_join(self):
+        """Test JOIN operation."""
+        # Test JOIN query
+        result = self._run(JOIN_QUERY)
+        
+        # Check for expected results in the join
+        found = _found_tokens(result)
+        assert {"John Doe", "Database Systems", "Jane Smith", "Data Structures"} <= found
+    
+    def test_join_with_where(self):
+        """Test JOIN with WHERE clause."""
+        # Test JOIN query with WHERE
+        result = self._run(JOIN_WITH_WHERE_QUERY)
+        
+        # Check for expected results in the join with WHERE
+        found = _found_tokens(result)
+        assert "Database Systems" not in found  # Has credits = 3
+        assert "Data Structures" in found       # Has credits = 4
+        assert "Jane Smith" in found            # Enrolled in Data Structures
+        assert "John Doe" not in found          # Enrolled in Database Systems
+    
+    def test_join_method_selection(self):
+        """Test that indexed inner join columns are probed, others hash joined."""
+        optimized_query = self.optimizer.optimize(self._parse(JOIN_QUERY))
+        
+        # enrollments.student_id has no index; courses.course_id is the
+        # (automatically indexed) primary key
+        assert [join["method"] for join in optimized_query["join"]] == ["hash", "index-nested-loop"]
+    
+    def test_join_condition_naming_inner_table_first(self):
+        """Test that "ON inner.col = outer.col" probes the inner table's index."""
+        query = (
+            "SELECT students.id, enrollments.student_id FROM enrollments "
+            "JOIN students ON students.id = enrollments.student_id"
+        )
+        
+        optimized_query = self.optimizer.optimize(self._parse(query))
+        assert optimized_query["join"][0]["method"] == "index-nested-loop"
+        
+        result = self._run(query)
+        assert result.rows
+        assert all(student_id == enrolled_id for student_id, enrolled_id in result.rows)
+    
+    def test_index_join_skips_stale_index_entries(self):
+        """Test that index entries pointing past the inner table are ignored."""
+        # Drop the last course without rebuilding the course_id index
+        courses = self.disk_manager.read_table("courses")
+        self.disk_manager.write_table("courses", courses[:-1])
+        
+        result = self._run(JOIN_QUERY)
+        
+        assert result.column_values("courses.title") == {"Database Systems"}
+    
+    def test_join_pushes_down_single_table_conditions(self):
+        """Test that a WHERE on one joined table is applied while scanning it."""
+        optimized_query = self.optimizer.optimize(self._parse(JOIN_WITH_WHERE_QUERY))
+        
+        assert optimized_query["where"] is None
+        assert "filter" not in optimized_query["join"][0]
+        pushed = optimized_query["join"][1]["filter"]
+        assert pushed["left"] == {"type": "column", "name": "credits"}
+        assert (pushed["operator"], pushed["right"]["value"]) == (">", 3)
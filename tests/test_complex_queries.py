@@ -3,6 +3,8 @@ Tests for complex SQL query scenarios.
 """
 
 import os
+import sys
+import stat
 import shutil
 import pytest
 
@@ -14,8 +16,26 @@ from query.optimizer import QueryOptimizer
 from execution.executor import Executor
 from common.exceptions import DBMSError
 
-# Test database directory
-TEST_DB_DIR = "./test_database_complex"
+# Test database directory, one per xdist worker so parallel runs never share files
+TEST_DB_DIR = f"./test_database_complex_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+
+# Shared parser; parse() resets its own state between queries
+_PARSER = SQLParser()
+
+def _retry_removal(func, path, exc):
+    """
+    rmtree error handler: retry an entry that could not be removed for lack
+    of permission once it is writable; re-raise any other error as is.
+    
+    Used as onexc on Python 3.12+, and as onerror (which passes exc_info)
+    before that.
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if not isinstance(exc, PermissionError):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
 
 class TestComplexQueries:
     """Test complex SQL queries to identify parser limitations."""
@@ -30,7 +50,7 @@ class TestComplexQueries:
         cls.disk_manager = DiskManager(TEST_DB_DIR)
         cls.schema_manager = SchemaManager(cls.disk_manager)
         cls.index_manager = IndexManager(cls.disk_manager)
-        cls.parser = SQLParser()
+        cls.parser = _PARSER
         cls.optimizer = QueryOptimizer(cls.schema_manager, cls.index_manager)
         cls.executor = Executor(
             cls.schema_manager, 
@@ -38,27 +58,29 @@ class TestComplexQueries:
             cls.index_manager,
             cls.optimizer
         )
+        
+        # Build the shared tables once; each test rolls back to this state
+        cls._create_test_schema()
     
     @classmethod
     def teardown_class(cls):
         """Clean up the test environment."""
         # Remove test database directory
-        shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(TEST_DB_DIR, onexc=_retry_removal)
+        else:
+            shutil.rmtree(TEST_DB_DIR, onerror=_retry_removal)
     
     def setup_method(self):
         """Set up before each test method."""
-        # Drop any existing tables
-        try:
-            for table in self.schema_manager.get_tables():
-                query = f"DROP TABLE {table}"
-                parsed_query = self.parser.parse(query)
-                self.executor.execute(parsed_query)
-        except:
-            # Ignore errors during setup
-            pass
-        
-        # Create test tables for complex queries
-        self._create_test_schema()
+        # Snapshot the test tables so this test's changes can be undone
+        self.disk_manager.begin_savepoint()
+    
+    def teardown_method(self):
+        """Clean up after each test method."""
+        # Restore the pristine test tables and reload their catalog
+        self.disk_manager.rollback_savepoint()
+        self.schema_manager.load_schema()
     
     def test_complex_select_with_multiple_conditions(self):
         """Test complex SELECT with multiple WHERE conditions."""
@@ -103,11 +125,11 @@ class TestComplexQueries:
         print("RESULT:", result)
         
         # Our test case has these values in tests
-        assert "Bob" in result
+        assert "Bob" in result.column_values("students.name")
         # In our test data, Bob should be in both Database Fundamentals and Advanced SQL
         # But the test data doesn't seem to be set up correctly, so adjust the assertion to what's in the actual data
-        assert "Database Fundamentals" in result
-        assert any(score in result for score in ["85", "92"])
+        assert "Database Fundamentals" in result.column_values("courses.title")
+        assert result.column_values("grades.score") & {85, 92}
     
     def test_multiline_batch_queries(self):
         """Test running multiple queries in a batch."""
@@ -121,14 +143,10 @@ class TestComplexQueries:
         """
         
         try:
-            # Split the batch into individual queries and run them
-            queries = multiline_batch.strip().split(';')
+            # Parse the whole batch, then run its statements in order
             results = []
             
-            for query in queries:
-                if not query.strip():
-                    continue
-                parsed_query = self.parser.parse(query)
+            for parsed_query in self.parser.parse_batch(multiline_batch):
                 result = self.executor.execute(parsed_query)
                 results.append(result)
             
@@ -270,21 +288,11 @@ class TestComplexQueries:
         LIMIT 2
         """
         
-        try:
-            parsed_query = self.parser.parse(query)
-            result = self.executor.execute(parsed_query)
-            
-            # Count the number of data rows in the result
-            data_rows = [line for line in result.split('\n') if '|' in line]
-            # Remove the header row
-            data_rows = data_rows[1:]
-            
-            # Should only have 2 result rows due to LIMIT
-            assert len(data_rows) == 2
-        except Exception as e:
-            # The current parser might not support LIMIT
-            # This is expected to fail if the feature doesn't exist yet
-            pytest.xfail(f"LIMIT clause not supported: {str(e)}")
+        parsed_query = self.parser.parse(query)
+        result = self.executor.execute(parsed_query)
+        
+        # Should only have 2 result rows due to LIMIT
+        assert len(result.rows) == 2
     
     def test_offset(self):
         """Test OFFSET clause with LIMIT."""
@@ -319,107 +327,94 @@ class TestComplexQueries:
         parsed_query = self.parser.parse(query)
         result = self.executor.execute(parsed_query)
         
-        # Should skip the first row and show the next 2
-        assert "First" not in result  # Skipped by OFFSET 1
-        assert "Second" in result    # First result after offset
-        assert "Third" in result     # Second result after offset
-        assert "Fourth" not in result # Beyond LIMIT 2
+        # Should skip the first row ("First") and show the next 2, not "Fourth"
+        name_index = result.columns.index("name")
+        assert [row[name_index] for row in result.rows] == ["Second", "Third"]
     
     # Helper methods to set up test data
-    def _create_test_schema(self):
+    @classmethod
+    def _create_test_schema(cls):
         """Create test tables and insert sample data."""
-        # Create students table
-        query = """
-        CREATE TABLE students (
-            id INTEGER PRIMARY KEY,
-            name STRING,
-            age INTEGER,
-            grade INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Insert sample students
-        students = [
-            "INSERT INTO students VALUES (1, 'Alice', 21, 78)",
-            "INSERT INTO students VALUES (2, 'Bob', 22, 85)",
-            "INSERT INTO students VALUES (3, 'Charlie', 20, 92)",
-            "INSERT INTO students VALUES (4, 'Dave', 19, 65)"
-        ]
-        
-        for query in students:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
-        
-        # Create courses table
-        query = """
-        CREATE TABLE courses (
-            id INTEGER PRIMARY KEY,
-            title STRING,
-            credits INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Print to verify table creation succeeded
-        print("Created courses table")
-        
-        # Insert sample courses
-        courses = [
-            "INSERT INTO courses VALUES (1, 'Database Fundamentals', 3)",
-            "INSERT INTO courses VALUES (2, 'Advanced SQL', 4)",
-            "INSERT INTO courses VALUES (3, 'Data Structures', 3)"
-        ]
-        
-        for query in courses:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
-        
-        # Create enrollments table (join table)
-        query = """
-        CREATE TABLE enrollments (
-            id INTEGER PRIMARY KEY,
-            student_id INTEGER,
-            course_id INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Insert sample enrollments
-        enrollments = [
-            "INSERT INTO enrollments VALUES (1, 1, 1)",  # Alice in Database Fundamentals
-            "INSERT INTO enrollments VALUES (2, 2, 1)",  # Bob in Database Fundamentals
-            "INSERT INTO enrollments VALUES (3, 2, 2)",  # Bob in Advanced SQL (course_id 2)
-            "INSERT INTO enrollments VALUES (4, 3, 3)"   # Charlie in Data Structures
-            # Dave is not enrolled in any course
-        ]
-        
-        for query in enrollments:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
-        
-        # Create grades table
-        query = """
-        CREATE TABLE grades (
-            id INTEGER PRIMARY KEY,
-            enrollment_id INTEGER,
-            score INTEGER
-        )
-        """
-        parsed_query = self.parser.parse(query)
-        self.executor.execute(parsed_query)
-        
-        # Insert sample grades
-        grades = [
-            "INSERT INTO grades VALUES (1, 1, 85)",  # Alice in Database Fundamentals
-            "INSERT INTO grades VALUES (2, 2, 78)",  # Bob in Database Fundamentals
-            "INSERT INTO grades VALUES (3, 3, 92)",  # Bob in Advanced SQL - course ID 2 - enrollment ID 3
-            "INSERT INTO grades VALUES (4, 4, 95)"   # Charlie in Data Structures
-        ]
-        
-        for query in grades:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
\ No newline at end of file
+        # Seed every table with a single schema write
+        with cls.schema_manager.batched():
+            # Create students table
+            query = """
+            CREATE TABLE students (
+                id INTEGER PRIMARY KEY,
+                name STRING,
+                age INTEGER,
+                grade INTEGER
+            )
+            """
+            parsed_query = cls.parser.parse(query)
+            cls.executor.execute(parsed_query)
+            
+            # Insert sample students
+            cls.executor.execute_bulk_insert("students", [
+                (1, 'Alice', 21, 78),
+                (2, 'Bob', 22, 85),
+                (3, 'Charlie', 20, 92),
+                (4, 'Dave', 19, 65)
+            ])
+            
+            # Create courses table
+            query = """
+            CREATE TABLE courses (
+                id INTEGER PRIMARY KEY,
+                title STRING,
+                credits INTEGER
+            )
+            """
+            parsed_query = cls.parser.parse(query)
+            cls.executor.execute(parsed_query)
+            
+            # Insert sample courses
+            cls.executor.execute_bulk_insert("courses", [
+                (1, 'Database Fundamentals', 3),
+                (2, 'Advanced SQL', 4),
+                (3, 'Data Structures', 3)
+            ])
+            
+            # Create enrollments table (join table)
+            query = """
+            CREATE TABLE enrollments (
+                id INTEGER PRIMARY KEY,
+                student_id INTEGER,
+                course_id INTEGER
+            )
+            """
+            parsed_query = cls.parser.parse(query)
+            cls.executor.execute(parsed_query)
+            
+            # Insert sample enrollments
+            cls.executor.execute_bulk_insert("enrollments", [
+                (1, 1, 1),  # Alice in Database Fundamentals
+                (2, 2, 1),  # Bob in Database Fundamentals
+                (3, 2, 2),  # Bob in Advanced SQL (course_id 2)
+                (4, 3, 3)   # Charlie in Data Structures
+                # Dave is not enrolled in any course
+            ])
+            
+            # Create grades table
+            query = """
+            CREATE TABLE grades (
+                id INTEGER PRIMARY KEY,
+                enrollment_id INTEGER,
+                score INTEGER
+            )
+            """
+            parsed_query = cls.parser.parse(query)
+            cls.executor.execute(parsed_query)
+            
+            # Insert sample grades
+            cls.executor.execute_bulk_insert("grades", [
+                (1, 1, 85),  # Alice in Database Fundamentals
+                (2, 2, 78),  # Bob in Database Fundamentals
+                (3, 3, 92),  # Bob in Advanced SQL - course ID 2 - enrollment ID 3
+                (4, 4, 95)   # Charlie in Data Structures
+            ])
+            
+            # Index the foreign-key join columns so joins can probe them
+            for query in ("CREATE INDEX ON enrollments (student_id)",
+                          "CREATE INDEX ON grades (enrollment_id)"):
+                cls.executor.execute(cls.parser.parse(query))
\ No newline at end of file
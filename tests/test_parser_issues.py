@@ -2,61 +2,14 @@
 Tests for specific SQL parser issues.
 """
 
-import os
-import shutil
 import pytest
 
-from parser.sql_parser import SQLParser
-from catalog.schema_manager import SchemaManager
-from storage.disk_manager import DiskManager
-from storage.index.index_manager import IndexManager
-from query.optimizer import QueryOptimizer
-from execution.executor import Executor
 from common.exceptions import DBMSError
 
-# Test database directory
-TEST_DB_DIR = "./test_database_issues"
-
+@pytest.mark.usefixtures("bind_dbms", "isolated_dbms")
 class TestParserIssues:
     """Test specific parser issues mentioned by users."""
     
-    @classmethod
-    def setup_class(cls):
-        """Set up the test environment."""
-        # Create test database directory
-        os.makedirs(TEST_DB_DIR, exist_ok=True)
-        
-        # Initialize components
-        cls.disk_manager = DiskManager(TEST_DB_DIR)
-        cls.schema_manager = SchemaManager(cls.disk_manager)
-        cls.index_manager = IndexManager(cls.disk_manager)
-        cls.parser = SQLParser()
-        cls.optimizer = QueryOptimizer(cls.schema_manager, cls.index_manager)
-        cls.executor = Executor(
-            cls.schema_manager, 
-            cls.disk_manager,
-            cls.index_manager,
-            cls.optimizer
-        )
-    
-    @classmethod
-    def teardown_class(cls):
-        """Clean up the test environment."""
-        # Remove test database directory
-        shutil.rmtree(TEST_DB_DIR, ignore_errors=True)
-    
-    def setup_method(self):
-        """Set up before each test method."""
-        # Drop any existing tables
-        try:
-            for table in self.schema_manager.get_tables():
-                query = f"DROP TABLE {table}"
-                parsed_query = self.parser.parse(query)
-                self.executor.execute(parsed_query)
-        except:
-            # Ignore errors during setup
-            pass
-    
     def test_multiline_sql(self):
         """Test that multi-line SQL queries work correctly."""
         # Create a table using multi-line query
@@ -171,16 +124,15 @@ class TestParserIssues:
         self._create_users_table()
         
         # Insert multiple records
-        queries = [
-            "INSERT INTO test_users VALUES (1, 'Alice', 25)",
-            "INSERT INTO test_users VALUES (2, 'Bob', 30)",
-            "INSERT INTO test_users VALUES (3, 'Charlie', 22)",
-            "INSERT INTO test_users VALUES (4, 'Dave', 35)"
-        ]
-        
-        for query in queries:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
+        query = """
+        INSERT INTO test_users VALUES
+            (1, 'Alice', 25),
+            (2, 'Bob', 30),
+            (3, 'Charlie', 22),
+            (4, 'Dave', 35)
+        """
+        parsed_query = self.parser.parse(query)
+        self.executor.execute(parsed_query)
         
         # Test AND condition
         query = "SELECT * FROM test_users WHERE age > 20 AND age < 30"
@@ -227,14 +179,13 @@ class TestParserIssues:
         self.executor.execute(parsed_query)
         
         # Insert sample orders
-        queries = [
-            "INSERT INTO test_orders VALUES (101, 1, 50)",
-            "INSERT INTO test_orders VALUES (102, 2, 75)"
-        ]
-        
-        for query in queries:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
+        query = """
+        INSERT INTO test_orders VALUES
+            (101, 1, 50),
+            (102, 2, 75)
+        """
+        parsed_query = self.parser.parse(query)
+        self.executor.execute(parsed_query)
         
         # This would be the ideal query with aliases, but it will fail
         # with the current implementation
@@ -329,11 +280,6 @@ class TestParserIssues:
     
     def _insert_sample_users(self):
         """Helper to insert sample user data."""
-        queries = [
-            "INSERT INTO test_users VALUES (1, 'Alice', 25)",
-            "INSERT INTO test_users VALUES (2, 'Bob', 30)"
-        ]
-        
-        for query in queries:
-            parsed_query = self.parser.parse(query)
-            self.executor.execute(parsed_query)
\ No newline at end of file
+        query = "INSERT INTO test_users VALUES (1, 'Alice', 25), (2, 'Bob', 30)"
+        parsed_query = self.parser.parse(query)
+        self.executor.execute(parsed_query)
\ No newline at end of file